@@ -0,0 +1,30 @@
+"""Rebuild the shipped sprite bbox cache.
+
+Run from the project root after adding or editing player or enemy sprites:
+
+    python build_bbox_cache.py
+
+The game then starts without scanning any frame's alpha channel.
+"""
+import os
+
+from kivy.core.window import Window  # noqa: F401 - textures need a GL context
+from kivy.vector import Vector
+
+import sprite_assets
+from enemy_entities import EnemyEntity, SpecialEnemyEntity
+from player_entity import PlayerEntity
+
+
+def main():
+    # Start from an empty cache so entries for removed frames are dropped
+    if os.path.exists(sprite_assets.BBOX_CACHE_PATH):
+        os.remove(sprite_assets.BBOX_CACHE_PATH)
+    EnemyEntity.preload_all_skins()
+    SpecialEnemyEntity.preload_all_skins()
+    PlayerEntity(Vector(0, 0))
+    print(f"Wrote {sprite_assets.BBOX_CACHE_PATH}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,23 +1,284 @@
-from typing import Dict, List, Tuple
+from typing import Dict, List, Set, Tuple
 import random
 import math
 
+import numpy as np
 from kivy.core.image import Image as CoreImage
 from kivy.core.window import Window
-from kivy.graphics import Color, PopMatrix, PushMatrix, Rectangle, Scale
+from kivy.graphics import Color, InstructionGroup, Mesh, Rectangle
 from kivy.vector import Vector
 
 from entity_base import Entity
 from projectile_entities import EnemyProjectileEntity
+from sprite_assets import (
+    compute_alpha_bbox,
+    decode_images,
+    decode_images_async,
+    flip_tex_coords_horizontal,
+    get_cached_bbox,
+    hitbox_params,
+    pack_textures,
+    scale_hitbox_params,
+    save_bbox_cache,
+    shared_pixel_reads,
+    store_bbox,
+    swatch_texture,
+)
+
+
+# Health bar background colour, shared by every enemy type
+HP_BAR_BG_RGBA = (0.15, 0.15, 0.15, 0.7)
+# Texel centres of the background/foreground colours in the bar swatch texture
+_BAR_BG_U = 0.25
+_BAR_FG_U = 0.75
+_BAR_MESH_INDICES = [0, 1, 2, 2, 3, 0, 4, 5, 6, 6, 7, 4]
+
+
+class _AnimatedSpriteMixin:
+    """Preloading, atlas packing and drawing shared by the enemy classes.
+
+    Subclasses provide their own ``_texture_cache``, ``_hitbox_params_cache``
+    and ``_base_size_cache`` dicts and ``_loaded_skins`` set so each class
+    keeps separate caches, plus the ``HITBOX_SHRINK`` baked into the hitbox
+    tables and the ``HP_BAR_*`` health bar style.
+    """
+    __slots__ = ()
 
+    @classmethod
+    def _load_animation_cached(cls, asset_path: str, name: str, prefix: str, count: int, decoded=None):
+        if asset_path not in cls._texture_cache:
+            cls._texture_cache[asset_path] = {}
+            cls._hitbox_params_cache[asset_path] = {}
+
+        if name in cls._texture_cache[asset_path]:
+            return
+
+        frames: List = []
+        bboxes: List[Tuple[float, float, float, float]] = []
+        for idx in range(1, count + 1):
+            path = f"{asset_path}/{prefix}{idx}.png"
+            try:
+                image = decoded.get(path) if decoded else None
+                texture = image.texture if image is not None else CoreImage(path).texture
+                frames.append(texture)
+                bbox = get_cached_bbox(path)
+                if bbox is None:
+                    bbox = compute_alpha_bbox(texture)
+                    store_bbox(path, bbox)
+                bboxes.append(bbox)
+            except Exception as exc:
+                print(f"Failed to load {path}: {exc}")
+
+        if frames:
+            cls._texture_cache[asset_path][name] = frames
+            cls._hitbox_params_cache[asset_path][name] = hitbox_params(bboxes, cls.HITBOX_SHRINK)
+            if name == "idle" and asset_path not in cls._base_size_cache:
+                cls._base_size_cache[asset_path] = (frames[0].width, frames[0].height)
+
+    @classmethod
+    def _ensure_skin_loaded(cls, asset_path: str):
+        """Load any missing animations for ``asset_path``; a no-op once it has been checked."""
+        if asset_path in cls._loaded_skins:
+            return
+        for name, prefix, count in cls._animation_specs(asset_path):
+            cls._load_animation_cached(asset_path, name, prefix, count)
+        cls._loaded_skins.add(asset_path)
+
+    @classmethod
+    def preload_all_skins(cls):
+        """Load every skin now, decoding the PNGs on a thread pool."""
+        tasks, paths = cls._preload_plan()
+        if paths:
+            cls._finish_preload(tasks, decode_images(paths, bbox_paths=cls._frame_paths(tasks)))
+
+    @classmethod
+    def preload_all_skins_async(cls, on_done):
+        """Like preload_all_skins, but decode on a background thread.
+
+        Textures are still created on the main thread from a Clock callback,
+        after which ``on_done()`` is called. Spawns that happen first simply
+        load their skin synchronously.
+        """
+        tasks, paths = cls._preload_plan()
+        if not paths:
+            on_done()
+            return
+
+        def finish(decoded):
+            cls._finish_preload(tasks, decoded)
+            on_done()
+
+        decode_images_async(paths, finish, bbox_paths=cls._frame_paths(tasks))
+
+    @classmethod
+    def _preload_plan(cls):
+        """Return ``(tasks, paths)`` for the animations that are not loaded yet."""
+        tasks = [
+            (skin, name, prefix, count)
+            for skin in cls.SKINS
+            for name, prefix, count in cls._animation_specs(skin)
+            if name not in cls._texture_cache.get(skin, {})
+        ]
+        return tasks, cls._frame_paths(tasks)
+
+    @staticmethod
+    def _frame_paths(tasks) -> List[str]:
+        return [
+            f"{skin}/{prefix}{idx}.png"
+            for skin, _name, prefix, count in tasks
+            for idx in range(1, count + 1)
+        ]
+
+    @classmethod
+    def _finish_preload(cls, tasks, decoded):
+        # Runs on the main thread: textures must be created where the GL context lives
+        with shared_pixel_reads():
+            for skin, name, prefix, count in tasks:
+                cls._load_animation_cached(skin, name, prefix, count, decoded)
+            # Spawns then skip the per-animation checks in _ensure_skin_loaded
+            cls._loaded_skins.update(skin for skin, _name, _prefix, _count in tasks)
+            save_bbox_cache()
+            cls._pack_into_atlas(tasks)
+
+    @classmethod
+    def _pack_into_atlas(cls, tasks):
+        """Swap freshly loaded frames for regions of shared atlas textures."""
+        loaded = [
+            (skin, name)
+            for skin, name, _prefix, _count in tasks
+            if name in cls._texture_cache.get(skin, {})
+        ]
+        frames = [frame for skin, name in loaded for frame in cls._texture_cache[skin][name]]
+        regions = iter(pack_textures(frames))
+        for skin, name in loaded:
+            cache = cls._texture_cache[skin]
+            cache[name][:] = [next(regions) for _ in cache[name]]
+
+    def _cache_walk_band(self, bounds: Tuple[float, float]):
+        """Recompute the walkable y-range (same rule as player) for ``bounds``."""
+        block_unit = bounds[1] / 10.0
+        self._min_y = block_unit
+        self._max_y_eff = max(block_unit, bounds[1] - (3 * block_unit) - self.size[1])
+        self._cached_bounds = bounds
+
+    def get_hitbox(self) -> Tuple[float, float, float, float]:
+        # Collision, melee, render and debug code all ask for the same box within a tick
+        pos = self.pos
+        x = pos.x
+        y = pos.y
+        frame = self.current_frame
+        facing = self.facing
+        key = (self._current_anim, frame, facing, x, y)
+        if key == self._hitbox_key:
+            return self._hitbox
+
+        rows = self._current_hit_rows
+        if rows is None:
+            hitbox = (x, y, self.size[0], self.size[1])
+        else:
+            x_right, x_left, y_off, hit_w, hit_h = rows[frame % len(rows)]
+            hitbox = (x + (x_right if facing == 1 else x_left), y + y_off, hit_w, hit_h)
+
+        self._hitbox_key = key
+        self._hitbox = hitbox
+        return hitbox
+
+    @property
+    def max_hp(self) -> float:
+        return self._max_hp
+
+    @max_hp.setter
+    def max_hp(self, value: float):
+        # draw() scales the health bar by the reciprocal every frame
+        self._max_hp = value
+        self._inv_max_hp = 1.0 / value
+
+    def draw(self, canvas):
+        frames = self._current_frames
+        if not frames:
+            return
+        pos = self.pos
+        x = pos.x
+        y = pos.y
+        width, height = self.size
+        texture = frames[self.current_frame]
+        # Health bar based on hitbox
+        hit_x, hit_y, hit_w, hit_h = self.get_hitbox()
+        hp_ratio = self.hp * self._inv_max_hp
+        if hp_ratio < 0.0:
+            hp_ratio = 0.0
+        elif hp_ratio > 1.0:
+            hp_ratio = 1.0
+        x1 = hit_x + hit_w
+        fill_x = hit_x + hit_w * hp_ratio
+        y0 = hit_y + hit_h + self.HP_BAR_LIFT
+        y1 = y0 + self.HP_BAR_HEIGHT
+        bg_u = _BAR_BG_U
+        fg_u = _BAR_FG_U
+        self._bar_mesh.vertices = [
+            hit_x, y0, bg_u, 0.5, x1, y0, bg_u, 0.5, x1, y1, bg_u, 0.5, hit_x, y1, bg_u, 0.5,
+            hit_x, y0, fg_u, 0.5, fill_x, y0, fg_u, 0.5, fill_x, y1, fg_u, 0.5, hit_x, y1, fg_u, 0.5,
+        ]
+
+        # Draw sprite with hit flash
+        self._tint.rgba = (1, 0.3, 0.3, 1) if self.hit_flash_timer > 0 else (1, 1, 1, 1)
+        sprite = self._sprite
+        facing = self.facing
+        if texture is not self._cur_texture or facing != self._cur_facing:
+            # Only touch the texture/UVs when the frame or facing actually changed
+            self._cur_texture = texture
+            self._cur_facing = facing
+            sprite.texture = texture
+            # Mirror UVs for left-facing sprites instead of a PushMatrix/Scale pair
+            sprite.tex_coords = flip_tex_coords_horizontal(texture.tex_coords) if facing == -1 else texture.tex_coords
+        sprite.pos = (x, y)
+        sprite.size = (width, height)
+        canvas.add(self._gfx)
+
+    def _build_graphics(self):
+        """Create the instructions reused by draw() every frame."""
+        self._gfx = InstructionGroup()
+        # Both health bar quads share one mesh; their colours come from a swatch texture
+        self._gfx.add(Color(1, 1, 1, 1))
+        self._bar_mesh = Mesh(
+            mode="triangles",
+            indices=_BAR_MESH_INDICES,
+            texture=swatch_texture((HP_BAR_BG_RGBA, self.HP_BAR_RGBA)),
+        )
+        self._gfx.add(self._bar_mesh)
+        self._tint = Color(1, 1, 1, 1)
+        self._gfx.add(self._tint)
+        self._sprite = Rectangle()
+        self._gfx.add(self._sprite)
+        self._cur_texture = None
+        self._cur_facing = 0
 
-class EnemyEntity(Entity):
+
+class EnemyEntity(_AnimatedSpriteMixin, Entity):
     """Sprite-based enemy with idle/walk/attack/hurt/dead animations."""
+    __slots__ = (
+        "asset_path", "animations", "anim_hit_params", "_max_hp", "_inv_max_hp", "hp", "damage",
+        "_hit_rows", "_current_anim", "_current_frames", "_frame_count", "_current_hit_rows", "_current_anim_speed",
+        "current_frame", "frame_timer", "animation_speed", "attack_anim_speed",
+        "facing", "speed", "spawn_order", "separation_radius",
+        "attack_enter_dist", "attack_exit_dist", "is_dying", "death_anim_done",
+        "damage_cooldown", "hit_flash_timer", "target_pos", "is_attacking",
+        "_gfx", "_bar_mesh", "_tint", "_sprite",
+        "_cur_texture", "_cur_facing", "_hitbox_key", "_hitbox",
+        "_attack_hitbox_src", "_attack_hitbox",
+        "_cached_bounds", "_min_y", "_max_y_eff",
+    )
+
     DESIGN_HEIGHT = 1080
+    HITBOX_SHRINK = 0.82
+    HP_BAR_RGBA = (1, 0.15, 0.15, 1)  # red
+    HP_BAR_LIFT = 53  # ยกขึ้นอีก 50px
+    HP_BAR_HEIGHT = 6
 
     _texture_cache: Dict[str, Dict[str, List]] = {}
-    _bbox_cache: Dict[str, Dict[str, List[Tuple[float, float, float, float]]]] = {}
+    _hitbox_params_cache: Dict[str, Dict[str, np.ndarray]] = {}  # (frames, 5) float32 per animation, see hitbox_params
     _base_size_cache: Dict[str, Tuple[float, float]] = {}
+    _loaded_skins: Set[str] = set()
 
     SKINS = [
         "game_picture/enemy/Zombie_1",
@@ -26,6 +287,18 @@ class EnemyEntity(Entity):
         "game_picture/enemy/Zombie_4",
     ]
 
+    # Released enemies waiting to be reused by acquire()
+    _pool: List["EnemyEntity"] = []
+
+    # (animation name, file prefix, frame count)
+    ANIMATIONS = (
+        ("idle", "Idle", 6),
+        ("walk", "Walk", 10),
+        ("attack", "Attack", 5),
+        ("hurt", "Hurt", 4),
+        ("dead", "Dead", 5),
+    )
+
     # Per-skin combat stats: Zombie_1=Normal, Zombie_2=Tank, Zombie_3=Fast, Zombie_4=Heavy
     SKIN_STATS = {
         "game_picture/enemy/Zombie_1": {  # Normal — balanced all-rounder
@@ -47,77 +320,38 @@ class EnemyEntity(Entity):
     }
 
     @classmethod
-    def _load_animation_cached(cls, asset_path: str, name: str, prefix: str, count: int):
-        if asset_path not in cls._texture_cache:
-            cls._texture_cache[asset_path] = {}
-            cls._bbox_cache[asset_path] = {}
-
-        if name in cls._texture_cache[asset_path]:
-            return
+    def _animation_specs(cls, asset_path: str):
+        return cls.ANIMATIONS
 
-        frames: List = []
-        bboxes: List[Tuple[float, float, float, float]] = []
-        for idx in range(1, count + 1):
-            path = f"{asset_path}/{prefix}{idx}.png"
-            try:
-                texture = CoreImage(path).texture
-                frames.append(texture)
-                bboxes.append(cls._compute_bbox_static(texture))
-            except Exception as exc:
-                print(f"Failed to load {path}: {exc}")
-
-        if frames:
-            cls._texture_cache[asset_path][name] = frames
-            cls._bbox_cache[asset_path][name] = bboxes
-            if name == "idle" and asset_path not in cls._base_size_cache:
-                cls._base_size_cache[asset_path] = (frames[0].width, frames[0].height)
+    def __init__(self, pos: Vector, player_size: Tuple[float, float] = None, scale_to_player: float = 1.0, asset_path: str = None):
+        self._build_graphics()
+        self._init_or_reset(pos, player_size, scale_to_player, asset_path)
 
-    @staticmethod
-    def _compute_bbox_static(texture) -> Tuple[float, float, float, float]:
-        w, h = texture.size
-        pixels = texture.pixels
-        min_x, min_y = w, h
-        max_x, max_y = -1, -1
-        for y in range(h):
-            row_start = y * w * 4
-            for x in range(w):
-                alpha = pixels[row_start + x * 4 + 3]
-                if alpha > 10:
-                    if x < min_x:
-                        min_x = x
-                    if y < min_y:
-                        min_y = y
-                    if x > max_x:
-                        max_x = x
-                    if y > max_y:
-                        max_y = y
-        if max_x == -1:
-            return (0.0, 0.0, 1.0, 1.0)
-        return (min_x / w, min_y / h, (max_x - min_x + 1) / w, (max_y - min_y + 1) / h)
+    @classmethod
+    def acquire(cls, pos: Vector, player_size: Tuple[float, float] = None, scale_to_player: float = 1.0,
+                asset_path: str = None) -> "EnemyEntity":
+        """Return a fresh enemy, recycling one handed back via release() when possible."""
+        if cls._pool:
+            enemy = cls._pool.pop()
+            enemy._init_or_reset(pos, player_size, scale_to_player, asset_path)
+            return enemy
+        return cls(pos, player_size, scale_to_player, asset_path)
 
     @classmethod
-    def preload_all_skins(cls):
-        for skin in cls.SKINS:
-            cls._load_animation_cached(skin, "idle", "Idle", 6)
-            cls._load_animation_cached(skin, "walk", "Walk", 10)
-            cls._load_animation_cached(skin, "attack", "Attack", 5)
-            cls._load_animation_cached(skin, "hurt", "Hurt", 4)
-            cls._load_animation_cached(skin, "dead", "Dead", 5)
+    def release(cls, enemy: "EnemyEntity"):
+        """Hand a removed enemy back so a later spawn can reuse it."""
+        cls._pool.append(enemy)
 
-    def __init__(self, pos: Vector, player_size: Tuple[float, float] = None, scale_to_player: float = 1.0, asset_path: str = None):
+    def _init_or_reset(self, pos: Vector, player_size: Tuple[float, float], scale_to_player: float, asset_path: str):
         if asset_path is None:
             self.asset_path = random.choice(self.SKINS)
         else:
             self.asset_path = asset_path
 
-        self._load_animation_cached(self.asset_path, "idle", "Idle", 6)
-        self._load_animation_cached(self.asset_path, "walk", "Walk", 10)
-        self._load_animation_cached(self.asset_path, "attack", "Attack", 5)
-        self._load_animation_cached(self.asset_path, "hurt", "Hurt", 4)
-        self._load_animation_cached(self.asset_path, "dead", "Dead", 5)
+        self._ensure_skin_loaded(self.asset_path)
 
         self.animations = self._texture_cache[self.asset_path]
-        self.anim_bboxes = self._bbox_cache[self.asset_path]
+        self.anim_hit_params = self._hitbox_params_cache[self.asset_path]
 
         base_size = self._base_size_cache.get(self.asset_path, (100, 100))
 
@@ -131,6 +365,7 @@ class EnemyEntity(Entity):
         height = base_size[1] * scale
 
         super().__init__(pos=pos, size=(width, height), color=(1, 1, 1))
+        self._hit_rows = scale_hitbox_params(self.anim_hit_params, width, height)
 
         # Apply per-skin stats (Normal / Tank / Fast / Heavy)
         stats = self.SKIN_STATS.get(self.asset_path, self.SKIN_STATS["game_picture/enemy/Zombie_1"])
@@ -138,11 +373,11 @@ class EnemyEntity(Entity):
         self.hp = self.max_hp
         self.damage = stats["damage"]
 
+        self.animation_speed = 0.1
+        self.attack_anim_speed = stats["attack_anim_speed"]
         self.current_anim = "walk"
         self.current_frame = 0
         self.frame_timer = 0.0
-        self.animation_speed = 0.1
-        self.attack_anim_speed = stats["attack_anim_speed"]
         self.facing = -1
         self.speed = stats["speed"]
         self.spawn_order = 0
@@ -155,6 +390,12 @@ class EnemyEntity(Entity):
         self.hit_flash_timer = 0.0  # red flash on hit
 
         self.target_pos: Vector = pos
+        self.is_attacking = False
+        self._hitbox_key = None
+        self._hitbox = None
+        self._attack_hitbox_src = None
+        self._attack_hitbox = None
+        self._cached_bounds = None
 
     def take_damage(self, amount: float) -> bool:
         """Apply damage. Returns True if enemy died."""
@@ -171,6 +412,19 @@ class EnemyEntity(Entity):
             return True
         return False
 
+    @property
+    def current_anim(self) -> str:
+        return self._current_anim
+
+    @current_anim.setter
+    def current_anim(self, value: str):
+        # Cache the per-animation lookups so update/get_hitbox/draw skip the dict hashes.
+        self._current_anim = value
+        self._current_frames = self.animations.get(value, [])
+        self._frame_count = len(self._current_frames)
+        self._current_hit_rows = self._hit_rows.get(value)
+        self._current_anim_speed = self.attack_anim_speed if value == "attack" else self.animation_speed
+
     def get_render_danger_priority(self) -> int:
         priority = 1
         if self.current_anim == "attack":
@@ -178,61 +432,79 @@ class EnemyEntity(Entity):
         return priority
 
     def update(self, dt: float, player_pos: Vector, bounds: Tuple[float, float]):
-        self.update_statuses(dt)
-
-        # Tick damage cooldown
-        if self.damage_cooldown > 0:
-            self.damage_cooldown -= dt
-
-        # Hit flash countdown
-        if self.hit_flash_timer > 0:
-            self.hit_flash_timer -= dt
+        self.update_all((self,), dt, player_pos, bounds)
 
-        # Death animation — play once then mark done
-        if self.is_dying:
-            frames = self.animations.get("dead", [])
-            if frames and not self.death_anim_done:
-                self.frame_timer += dt
-                if self.frame_timer >= self.animation_speed:
-                    self.frame_timer = 0.0
-                    if self.current_frame < len(frames) - 1:
-                        self.current_frame += 1
-                    else:
-                        self.death_anim_done = True
-            return
-
-        self.target_pos = player_pos
-        enemy_center = self.pos + Vector(self.size[0] / 2, self.size[1] / 2)
-        direction = self.target_pos - enemy_center
-        distance = direction.length()
-
-        move_speed = self.speed * self.get_status_multiplier("move_speed", default=1.0)
-
-        if distance > 60:
-            move_vec = direction.normalize() * (move_speed * dt)
-            self.pos = self.pos + move_vec
-
-            if direction.x < 0:
-                self.facing = -1
-            else:
-                self.facing = 1
-
-        self.pos.x = max(0, min(self.pos.x, bounds[0] - self.size[0]))
-        # Clamp Y to walkable band (same rule as player)
-        block_unit = bounds[1] / 10.0
-        min_y = block_unit
-        max_y = bounds[1] - (3 * block_unit) - self.size[1]
-        self.pos.y = max(min_y, min(self.pos.y, max(min_y, max_y)))
-
-        frames = self.animations.get(self.current_anim, [])
-        if not frames:
-            return
-
-        anim_speed = self.attack_anim_speed if self.current_anim == "attack" else self.animation_speed
-        self.frame_timer += dt
-        if self.frame_timer >= anim_speed:
-            self.frame_timer = 0.0
-            self.current_frame = (self.current_frame + 1) % len(frames)
+    @classmethod
+    def update_all(cls, enemies, dt: float, player_pos: Vector, bounds: Tuple[float, float]):
+        """Advance a batch of enemies in a single pass.
+
+        Frame-invariant values (player position, bounds) are read once per
+        call instead of once per enemy.
+        """
+        player_x = player_pos.x
+        player_y = player_pos.y
+        max_x_bound = bounds[0]
+
+        for enemy in enemies:
+            # Hit flash countdown
+            if enemy.hit_flash_timer > 0:
+                enemy.hit_flash_timer -= dt
+
+            # Death animation — play once then mark done. Dying enemies can no
+            # longer move or attack, so statuses and the damage cooldown are left alone.
+            if enemy.is_dying:
+                if not enemy.death_anim_done:
+                    frames = enemy.animations.get("dead")
+                    if frames:
+                        enemy.frame_timer += dt
+                        if enemy.frame_timer >= enemy.animation_speed:
+                            enemy.frame_timer = 0.0
+                            if enemy.current_frame < len(frames) - 1:
+                                enemy.current_frame += 1
+                            else:
+                                enemy.death_anim_done = True
+                continue
+
+            enemy.update_statuses(dt)
+
+            # Tick damage cooldown
+            if enemy.damage_cooldown > 0:
+                enemy.damage_cooldown -= dt
+
+            enemy.target_pos = player_pos
+            pos = enemy.pos
+            width, height = enemy.size
+            dx = player_x - (pos.x + width / 2)
+            dy = player_y - (pos.y + height / 2)
+
+            # Compare squared distance; only take the root when the enemy actually moves
+            dist_sq = dx * dx + dy * dy
+            if dist_sq > 3600.0:
+                distance = math.sqrt(dist_sq)
+                step = enemy.speed * enemy.get_status_multiplier("move_speed", default=1.0) * dt
+                pos.x += dx / distance * step
+                pos.y += dy / distance * step
+                enemy.facing = 1 - 2 * (dx < 0)
+
+            pos.x = max(0, min(pos.x, max_x_bound - width))
+            if enemy._cached_bounds is not bounds:
+                enemy._cache_walk_band(bounds)
+            pos.y = min(enemy._max_y_eff, max(enemy._min_y, pos.y))
+
+            frames = enemy._current_frames
+            if not frames:
+                continue
+
+            enemy.frame_timer += dt
+            anim_speed = enemy._current_anim_speed
+            if enemy.frame_timer >= anim_speed:
+                # A long tick can cover several frames; carry the remainder over
+                steps = int(enemy.frame_timer / anim_speed)
+                enemy.frame_timer -= steps * anim_speed
+                next_frame = enemy.current_frame + steps
+                if next_frame >= enemy._frame_count:
+                    next_frame %= enemy._frame_count
+                enemy.current_frame = next_frame
 
     def get_path_points(self) -> Tuple[float, float, float, float]:
         center_x = self.pos.x + self.size[0] / 2
@@ -241,35 +513,15 @@ class EnemyEntity(Entity):
         target_y = self.target_pos.y
         return (center_x, center_y, target_x, target_y)
 
-    def get_hitbox(self) -> Tuple[float, float, float, float]:
-        bboxes = self.anim_bboxes.get(self.current_anim)
-        if not bboxes:
-            return (self.pos.x, self.pos.y, self.size[0], self.size[1])
-        bbox = bboxes[self.current_frame % len(bboxes)]
-        bx, by, bw, bh = bbox
-        offset_x = bx * self.size[0] if self.facing == 1 else (1 - (bx + bw)) * self.size[0]
-        offset_y = (1 - (by + bh)) * self.size[1]
-
-        shrink_scale = 0.82
-        raw_w = bw * self.size[0]
-        raw_h = bh * self.size[1]
-        hit_w = raw_w * shrink_scale
-        hit_h = raw_h * shrink_scale
-        inset_x = (raw_w - hit_w) / 2
-        inset_y = (raw_h - hit_h) / 2
-
-        return (
-            self.pos.x + offset_x + inset_x,
-            self.pos.y + offset_y + inset_y,
-            hit_w,
-            hit_h,
-        )
-
     def get_attack_hitbox(self) -> Tuple[float, float, float, float]:
         if self.current_anim != "attack":
             return None
 
-        hx, hy, hw, hh = self.get_hitbox()
+        hitbox = self.get_hitbox()
+        # get_hitbox returns the same tuple until frame, facing or position change
+        if hitbox is self._attack_hitbox_src:
+            return self._attack_hitbox
+        hx, hy, hw, hh = hitbox
         hand_w = hw * 0.22
         hand_h = hh * 0.22
 
@@ -279,49 +531,39 @@ class EnemyEntity(Entity):
             hand_x = hx - (hand_w * 0.65)
 
         hand_y = hy + hh * 0.42
-        return (hand_x, hand_y, hand_w, hand_h)
+        self._attack_hitbox_src = hitbox
+        self._attack_hitbox = (hand_x, hand_y, hand_w, hand_h)
+        return self._attack_hitbox
 
-    def draw(self, canvas):
-        texture = self.animations.get(self.current_anim, [None])[self.current_frame]
-        if texture is None:
-            return
-        x, y = self.pos.x, self.pos.y
-        # Health bar based on hitbox
-        hit_x, hit_y, hit_w, hit_h = self.get_hitbox()
-        bar_width = hit_w
-        bar_height = 6
-        bar_x = hit_x
-        bar_y = hit_y + hit_h + 53  # ยกขึ้นอีก 50px
-        with canvas:
-            # Health bar background
-            Color(0.15, 0.15, 0.15, 0.7)
-            Rectangle(pos=(bar_x, bar_y), size=(bar_width, bar_height))
-            # Health bar foreground - red
-            hp_ratio = max(0.0, min(1.0, self.hp / self.max_hp))
-            Color(1, 0.15, 0.15, 1)
-            Rectangle(pos=(bar_x, bar_y), size=(bar_width * hp_ratio, bar_height))
-
-            # Draw enemy sprite with hit flash
-            if self.hit_flash_timer > 0:
-                Color(1, 0.3, 0.3, 1)  # red tint on hit
-            else:
-                Color(1, 1, 1, 1)
-            if self.facing == -1:
-                PushMatrix()
-                origin = (x + self.size[0] / 2, y + self.size[1] / 2)
-                Scale(x=-1, y=1, origin=origin)
-                Rectangle(texture=texture, pos=(x, y), size=self.size)
-                PopMatrix()
-            else:
-                Rectangle(texture=texture, pos=(x, y), size=self.size)
-
-
-class SpecialEnemyEntity(Entity):
+
+class SpecialEnemyEntity(_AnimatedSpriteMixin, Entity):
     """Special enemy with enhanced stats: 1.5x speed, 1.2x size. Spawns every 3 minutes."""
+    __slots__ = (
+        "asset_path", "animations", "anim_hit_params", "_max_hp", "_inv_max_hp", "hp", "damage",
+        "_hit_rows", "_current_anim", "_current_frames", "_frame_count", "_current_hit_rows", "_current_anim_speed",
+        "current_frame", "frame_timer", "animation_speed", "attack_anim_speed",
+        "facing", "speed", "spawn_order", "separation_radius",
+        "attack_enter_dist", "attack_exit_dist", "is_dying", "death_anim_done",
+        "damage_cooldown", "hit_flash_timer", "target_pos", "is_attacking",
+        "ai_state", "escape_distance", "attack_range", "fire_cooldown", "fire_timer", "is_kitsune",
+        "fire_textures", "_gfx", "_bar_mesh", "_tint", "_sprite",
+        "_cur_texture", "_cur_facing", "_hitbox_key", "_hitbox",
+        "_attack_hitbox_src", "_attack_hitbox",
+        "_cached_bounds", "_min_y", "_max_y_eff",
+        "_attack_hitbox_fn", "_danger_bonus",
+    )
 
     _texture_cache: Dict[str, Dict[str, List]] = {}
-    _bbox_cache: Dict[str, Dict[str, List[Tuple[float, float, float, float]]]] = {}
+    _hitbox_params_cache: Dict[str, Dict[str, np.ndarray]] = {}  # (frames, 5) float32 per animation, see hitbox_params
     _base_size_cache: Dict[str, Tuple[float, float]] = {}
+    _loaded_skins: Set[str] = set()
+    _fire_cache: Dict[str, List] = {}
+
+    FIRE_FRAME_COUNT = 14
+    HITBOX_SHRINK = 0.8
+    HP_BAR_RGBA = (0.7, 0.2, 1, 1)  # purple
+    HP_BAR_LIFT = 60  # สูงขึ้นอีก 50px
+    HP_BAR_HEIGHT = 8
 
     SKINS = [
         "game_picture/special_enemy/Gorgon",
@@ -329,6 +571,16 @@ class SpecialEnemyEntity(Entity):
         "game_picture/special_enemy/Red_Werewolf",
     ]
 
+    # (animation name, file prefix); frame counts come from ANIMATION_FRAMES
+    ANIMATION_PREFIXES = (
+        ("idle", "Idle"),
+        ("walk", "Walk"),
+        ("run", "Run"),
+        ("attack", "Attack_"),
+        ("hurt", "Hurt"),
+        ("dead", "Dead"),
+    )
+
     ANIMATION_FRAMES = {
         "game_picture/special_enemy/Gorgon": {
             "attack": 16,
@@ -376,64 +628,27 @@ class SpecialEnemyEntity(Entity):
     }
 
     @classmethod
-    def _load_animation_cached(cls, asset_path: str, name: str, prefix: str, count: int):
-        if asset_path not in cls._texture_cache:
-            cls._texture_cache[asset_path] = {}
-            cls._bbox_cache[asset_path] = {}
-
-        if name in cls._texture_cache[asset_path]:
-            return
+    def _animation_specs(cls, asset_path: str):
+        frames = cls.ANIMATION_FRAMES[asset_path]
+        return [(name, prefix, frames[name]) for name, prefix in cls.ANIMATION_PREFIXES]
 
-        frames: List = []
-        bboxes: List[Tuple[float, float, float, float]] = []
-        for idx in range(1, count + 1):
-            path = f"{asset_path}/{prefix}{idx}.png"
-            try:
-                texture = CoreImage(path).texture
-                frames.append(texture)
-                bboxes.append(cls._compute_bbox_static(texture))
-            except Exception as exc:
-                print(f"Failed to load {path}: {exc}")
-
-        if frames:
-            cls._texture_cache[asset_path][name] = frames
-            cls._bbox_cache[asset_path][name] = bboxes
-            if name == "idle" and asset_path not in cls._base_size_cache:
-                cls._base_size_cache[asset_path] = (frames[0].width, frames[0].height)
-
-    @staticmethod
-    def _compute_bbox_static(texture) -> Tuple[float, float, float, float]:
-        w, h = texture.size
-        pixels = texture.pixels
-        min_x, min_y = w, h
-        max_x, max_y = -1, -1
-        for y in range(h):
-            row_start = y * w * 4
-            for x in range(w):
-                alpha = pixels[row_start + x * 4 + 3]
-                if alpha > 10:
-                    if x < min_x:
-                        min_x = x
-                    if y < min_y:
-                        min_y = y
-                    if x > max_x:
-                        max_x = x
-                    if y > max_y:
-                        max_y = y
-        if max_x == -1:
-            return (0.0, 0.0, 1.0, 1.0)
-        return (min_x / w, min_y / h, (max_x - min_x + 1) / w, (max_y - min_y + 1) / h)
+    @classmethod
+    def _preload_plan(cls):
+        tasks, paths = super()._preload_plan()
+        paths += [
+            f"{skin}/Fire_{idx}.png"
+            for skin in cls.SKINS
+            if "Kitsune" in skin and skin not in cls._fire_cache
+            for idx in range(1, cls.FIRE_FRAME_COUNT + 1)
+        ]
+        return tasks, paths
 
     @classmethod
-    def preload_all_skins(cls):
+    def _finish_preload(cls, tasks, decoded):
         for skin in cls.SKINS:
-            frames = cls.ANIMATION_FRAMES[skin]
-            cls._load_animation_cached(skin, "idle", "Idle", frames["idle"])
-            cls._load_animation_cached(skin, "walk", "Walk", frames["walk"])
-            cls._load_animation_cached(skin, "run", "Run", frames["run"])
-            cls._load_animation_cached(skin, "attack", "Attack_", frames["attack"])
-            cls._load_animation_cached(skin, "hurt", "Hurt", frames["hurt"])
-            cls._load_animation_cached(skin, "dead", "Dead", frames["dead"])
+            if "Kitsune" in skin:
+                cls._load_fire_animation(skin, decoded)
+        super()._finish_preload(tasks, decoded)
 
     def __init__(self, pos: Vector, player_size: Tuple[float, float] = None, asset_path: str = None, special_index: int = 1):
         if asset_path is None:
@@ -441,16 +656,10 @@ class SpecialEnemyEntity(Entity):
         else:
             self.asset_path = asset_path
 
-        frames = self.ANIMATION_FRAMES[self.asset_path]
-        self._load_animation_cached(self.asset_path, "idle", "Idle", frames["idle"])
-        self._load_animation_cached(self.asset_path, "walk", "Walk", frames["walk"])
-        self._load_animation_cached(self.asset_path, "run", "Run", frames["run"])
-        self._load_animation_cached(self.asset_path, "attack", "Attack_", frames["attack"])
-        self._load_animation_cached(self.asset_path, "hurt", "Hurt", frames["hurt"])
-        self._load_animation_cached(self.asset_path, "dead", "Dead", frames["dead"])
+        self._ensure_skin_loaded(self.asset_path)
 
         self.animations = self._texture_cache[self.asset_path]
-        self.anim_bboxes = self._bbox_cache[self.asset_path]
+        self.anim_hit_params = self._hitbox_params_cache[self.asset_path]
 
         base_size = self._base_size_cache.get(self.asset_path, (100, 100))
 
@@ -464,6 +673,7 @@ class SpecialEnemyEntity(Entity):
         height = base_size[1] * scale
 
         super().__init__(pos=pos, size=(width, height), color=(1, 1, 1))
+        self._hit_rows = scale_hitbox_params(self.anim_hit_params, width, height)
 
         # Apply per-type boss stats
         stats = self.SKIN_STATS.get(self.asset_path, self.SKIN_STATS["game_picture/special_enemy/Gorgon"])
@@ -471,11 +681,11 @@ class SpecialEnemyEntity(Entity):
         self.hp = self.max_hp
         self.damage = stats["damage"]
 
+        self.animation_speed = 0.1
+        self.attack_anim_speed = stats["attack_anim_speed"]
         self.current_anim = "walk"
         self.current_frame = 0
         self.frame_timer = 0.0
-        self.animation_speed = 0.1
-        self.attack_anim_speed = stats["attack_anim_speed"]
         self.facing = -1
         self.speed = stats["speed"]
         self.spawn_order = 0
@@ -488,16 +698,29 @@ class SpecialEnemyEntity(Entity):
         self.hit_flash_timer = 0.0  # red flash on hit
 
         self.target_pos: Vector = pos
+        self.is_attacking = False
+        self._hitbox_key = None
+        self._hitbox = None
+        self._attack_hitbox_src = None
+        self._attack_hitbox = None
+        self._cached_bounds = None
+
+        self._build_graphics()
 
         self.ai_state = "approach"
         self.escape_distance = stats.get("escape_distance", 250)
         self.attack_range = stats.get("attack_range", 550)
         self.fire_cooldown = stats.get("fire_cooldown", 1.5)
         self.fire_timer = 0.0
-        self.fire_textures = []
-
-        if "Kitsune" in self.asset_path:
-            self._load_fire_animation()
+        self.is_kitsune = "Kitsune" in self.asset_path
+        # Resolve the per-skin behaviour once instead of substring checks every call
+        skin = self.asset_path.rsplit("/", 1)[-1]
+        self._attack_hitbox_fn = self.ATTACK_HITBOX_FNS.get(skin)
+        self._danger_bonus = 1 if skin in ("Gorgon", "Red_Werewolf") else 0
+        if self.is_kitsune:
+            self._load_fire_animation(self.asset_path)
+        # Shared with every Kitsune and its projectiles; treat as read-only
+        self.fire_textures = self._fire_cache.get(self.asset_path, [])
 
     def take_damage(self, amount: float) -> bool:
         """Apply damage. Returns True if enemy died."""
@@ -514,194 +737,231 @@ class SpecialEnemyEntity(Entity):
             return True
         return False
 
+    @property
+    def current_anim(self) -> str:
+        return self._current_anim
+
+    @current_anim.setter
+    def current_anim(self, value: str):
+        # Cache the per-animation lookups so update/get_hitbox/draw skip the dict hashes.
+        self._current_anim = value
+        self._current_frames = self.animations.get(value, [])
+        self._frame_count = len(self._current_frames)
+        self._current_hit_rows = self._hit_rows.get(value)
+        self._current_anim_speed = self.attack_anim_speed if value == "attack" else self.animation_speed
+
     def get_render_danger_priority(self) -> int:
-        priority = 2
+        priority = 2 + self._danger_bonus
 
-        if "Gorgon" in self.asset_path or "Red_Werewolf" in self.asset_path:
-            priority += 1
         if self.current_anim == "attack":
             priority += 2
-        if "Kitsune" in self.asset_path and self.ai_state == "ranged_attack":
+        if self.is_kitsune and self.ai_state == "ranged_attack":
             priority += 1
 
         return priority
 
-    def _load_fire_animation(self):
-        for idx in range(1, 15):
-            path = f"{self.asset_path}/Fire_{idx}.png"
+    @classmethod
+    def _load_fire_animation(cls, asset_path: str, decoded=None):
+        if asset_path in cls._fire_cache:
+            return
+        textures: List = []
+        for idx in range(1, cls.FIRE_FRAME_COUNT + 1):
+            path = f"{asset_path}/Fire_{idx}.png"
             try:
-                texture = CoreImage(path).texture
-                self.fire_textures.append(texture)
+                image = decoded.get(path) if decoded else None
+                textures.append(image.texture if image is not None else CoreImage(path).texture)
             except Exception as exc:
                 print(f"Failed to load fire texture {path}: {exc}")
+        cls._fire_cache[asset_path] = textures
 
     def update(self, dt: float, player_pos: Vector, bounds: Tuple[float, float], bullets=None):
-        self.update_statuses(dt)
-
-        # Tick damage cooldown
-        if self.damage_cooldown > 0:
-            self.damage_cooldown -= dt
-
         # Hit flash countdown
         if self.hit_flash_timer > 0:
             self.hit_flash_timer -= dt
 
-        # Death animation — play once then mark done
+        # Death animation — play once then mark done; nothing else ticks while dying
         if self.is_dying:
-            frames = self.animations.get("dead", [])
-            if frames and not self.death_anim_done:
-                self.frame_timer += dt
-                if self.frame_timer >= self.animation_speed:
-                    self.frame_timer = 0.0
-                    if self.current_frame < len(frames) - 1:
-                        self.current_frame += 1
-                    else:
-                        self.death_anim_done = True
+            if not self.death_anim_done:
+                frames = self.animations.get("dead")
+                if frames:
+                    self.frame_timer += dt
+                    if self.frame_timer >= self.animation_speed:
+                        self.frame_timer = 0.0
+                        if self.current_frame < len(frames) - 1:
+                            self.current_frame += 1
+                        else:
+                            self.death_anim_done = True
             return None
 
-        self.target_pos = player_pos
-
-        enemy_center = self.pos + Vector(self.size[0] / 2, self.size[1] / 2)
-        direction = self.target_pos - enemy_center
-        distance = direction.length()
-
-        if "Kitsune" in self.asset_path:
-            return self._update_kitsune_ai(dt, enemy_center, direction, distance, bounds, bullets)
+        self.update_statuses(dt)
 
-        move_speed = self.speed * self.get_status_multiplier("move_speed", default=1.0)
-        if distance > 10:
-            move_vec = direction.normalize() * (move_speed * dt)
-            self.pos = self.pos + move_vec
+        # Tick damage cooldown
+        if self.damage_cooldown > 0:
+            self.damage_cooldown -= dt
 
-            if direction.x < 0:
-                self.facing = -1
-            else:
-                self.facing = 1
+        self.target_pos = player_pos
 
-        self.pos.x = max(0, min(self.pos.x, bounds[0] - self.size[0]))
+        pos = self.pos
+        width, height = self.size
+        center_x = pos.x + width / 2
+        center_y = pos.y + height / 2
+        dx = player_pos.x - center_x
+        dy = player_pos.y - center_y
+        dist_sq = dx * dx + dy * dy
+
+        if self.is_kitsune:
+            return self._update_kitsune_ai(dt, center_x, center_y, dx, dy, math.sqrt(dist_sq), bounds, bullets)
+
+        if dist_sq > 100.0:
+            distance = math.sqrt(dist_sq)
+            step = self.speed * self.get_status_multiplier("move_speed", default=1.0) * dt
+            pos.x += dx / distance * step
+            pos.y += dy / distance * step
+            self.facing = 1 - 2 * (dx < 0)
+
+        pos.x = max(0, min(pos.x, bounds[0] - width))
         # Clamp Y to walkable band (same rule as player)
-        block_unit = bounds[1] / 10.0
-        min_y = block_unit
-        max_y = bounds[1] - (3 * block_unit) - self.size[1]
-        self.pos.y = max(min_y, min(self.pos.y, max(min_y, max_y)))
+        if self._cached_bounds is not bounds:
+            self._cache_walk_band(bounds)
+        pos.y = min(self._max_y_eff, max(self._min_y, pos.y))
 
-        frames = self.animations.get(self.current_anim, [])
+        frames = self._current_frames
         if not frames:
             return None
 
-        anim_speed = self.attack_anim_speed if self.current_anim == "attack" else self.animation_speed
-        self.frame_timer += dt
-        if self.frame_timer >= anim_speed:
-            self.frame_timer = 0.0
-            self.current_frame = (self.current_frame + 1) % len(frames)
-
+        self._advance_frame(dt)
         return None
 
-    def _update_kitsune_ai(self, dt: float, enemy_center: Vector, direction: Vector, distance: float, bounds: Tuple[float, float], bullets=None):
+    def _advance_frame(self, dt: float):
+        """Step the looping animation by however many frames ``dt`` covers."""
+        self.frame_timer += dt
+        anim_speed = self._current_anim_speed
+        if self.frame_timer >= anim_speed:
+            steps = int(self.frame_timer / anim_speed)
+            self.frame_timer -= steps * anim_speed
+            next_frame = self.current_frame + steps
+            if next_frame >= self._frame_count:
+                next_frame %= self._frame_count
+            self.current_frame = next_frame
+
+    def _update_kitsune_ai(self, dt: float, center_x: float, center_y: float, dx: float, dy: float,
+                           distance: float, bounds: Tuple[float, float], bullets=None):
         """Kitsune AI: ranged mage that keeps distance from player and dodges bullets."""
         projectile_to_spawn = None
         self.fire_timer += dt
         move_speed = self.speed * self.get_status_multiplier("move_speed", default=1.0)
 
         # --- Bullet dodge detection ---
-        dodge_vec = Vector(0, 0)
+        dodge_x = 0.0
+        dodge_y = 0.0
         dodge_detect_radius = 180  # pixels — how far ahead to scan for bullets
+        dodge_detect_radius_sq = dodge_detect_radius * dodge_detect_radius
         if bullets:
             for b in bullets:
                 # Vector from bullet to kitsune center
-                to_kit = enemy_center - b.pos
-                dist_to_bullet = to_kit.length()
-                if dist_to_bullet > dodge_detect_radius or dist_to_bullet < 1:
+                to_kit_x = center_x - b.pos.x
+                to_kit_y = center_y - b.pos.y
+                # Most bullets are far away; reject them before taking a root
+                dist_sq_to_bullet = to_kit_x * to_kit_x + to_kit_y * to_kit_y
+                if dist_sq_to_bullet > dodge_detect_radius_sq or dist_sq_to_bullet < 1:
                     continue
+                dist_to_bullet = math.sqrt(dist_sq_to_bullet)
                 # Check if bullet is heading towards kitsune
-                if b.velocity.length() < 1:
+                vel_x, vel_y = b.velocity
+                bullet_speed = math.hypot(vel_x, vel_y)
+                if bullet_speed < 1:
                     continue
-                bullet_dir = b.velocity.normalize()
+                dir_x = vel_x / bullet_speed
+                dir_y = vel_y / bullet_speed
                 # Dot product: positive means bullet is heading towards us
-                dot = bullet_dir.x * to_kit.x + bullet_dir.y * to_kit.y
-                if dot <= 0:
+                if dir_x * to_kit_x + dir_y * to_kit_y <= 0:
                     continue  # bullet heading away
                 # Perpendicular dodge direction (strafe away from bullet trajectory)
-                perp = Vector(-bullet_dir.y, bullet_dir.x)
+                perp_x, perp_y = -dir_y, dir_x
                 # Choose direction that moves away from bullet center
-                side = perp.x * to_kit.x + perp.y * to_kit.y
-                if side < 0:
-                    perp = Vector(bullet_dir.y, -bullet_dir.x)
+                if perp_x * to_kit_x + perp_y * to_kit_y < 0:
+                    perp_x, perp_y = dir_y, -dir_x
                 # Stronger dodge when bullet is closer
                 urgency = 1.0 - (dist_to_bullet / dodge_detect_radius)
-                dodge_vec += perp * urgency
+                dodge_x += perp_x * urgency
+                dodge_y += perp_y * urgency
 
         # Normalize aggregate dodge
-        is_dodging = dodge_vec.length() > 0.1
+        dodge_len = math.hypot(dodge_x, dodge_y)
+        is_dodging = dodge_len > 0.1
         if is_dodging:
-            dodge_vec = dodge_vec.normalize()
+            dodge_x /= dodge_len
+            dodge_y /= dodge_len
 
         # --- Movement logic ---
-        ideal_distance = (self.escape_distance + self.attack_range) / 2  # sweet spot ~450px
+        escape_distance = self.escape_distance
+        attack_range = self.attack_range
+        ideal_distance = (escape_distance + attack_range) / 2  # sweet spot ~450px
 
-        move_vec = Vector(0, 0)
+        move_x = 0.0
+        move_y = 0.0
 
-        if distance < self.escape_distance:
+        if distance < escape_distance:
             # Too close — run away from player
             self.ai_state = "escape"
             if distance > 0:
-                move_vec = (enemy_center - self.target_pos).normalize()
-        elif distance > self.attack_range:
+                move_x = -dx / distance
+                move_y = -dy / distance
+        elif distance > attack_range:
             # Too far — close in to attack range but not melee
             self.ai_state = "reposition"
             if distance > 0:
-                move_vec = direction.normalize() * 0.5  # approach slowly
+                move_x = dx / distance * 0.5  # approach slowly
+                move_y = dy / distance * 0.5
         else:
             # In attack range — strafe laterally to be unpredictable
             self.ai_state = "ranged_attack"
             # Gentle lateral drift (perpendicular to player direction)
-            if direction.length() > 0:
-                d_norm = direction.normalize()
-                lateral = Vector(-d_norm.y, d_norm.x)
+            if distance > 0:
+                norm_x = dx / distance
+                norm_y = dy / distance
                 # Oscillate direction using fire_timer as a simple clock
                 lateral_sign = 1.0 if math.sin(self.fire_timer * 2.0) > 0 else -1.0
-                move_vec = lateral * lateral_sign * 0.4
+                move_x = -norm_y * lateral_sign * 0.4
+                move_y = norm_x * lateral_sign * 0.4
                 # Also nudge toward ideal distance
                 dist_error = distance - ideal_distance
-                move_vec += d_norm * (dist_error / self.attack_range) * 0.3
+                move_x += norm_x * (dist_error / attack_range) * 0.3
+                move_y += norm_y * (dist_error / attack_range) * 0.3
 
         # Blend dodge into movement (dodge has high priority)
         if is_dodging:
-            move_vec = move_vec * 0.2 + dodge_vec * 1.5  # dodge dominates
+            move_x = move_x * 0.2 + dodge_x * 1.5  # dodge dominates
+            move_y = move_y * 0.2 + dodge_y * 1.5
 
-        if move_vec.length() > 0:
-            self.pos = self.pos + move_vec.normalize() * (move_speed * dt)
+        pos = self.pos
+        move_len = math.hypot(move_x, move_y)
+        if move_len > 0:
+            step = move_speed * dt
+            pos.x += move_x / move_len * step
+            pos.y += move_y / move_len * step
 
         # Face the player
-        if direction.x < 0:
-            self.facing = -1
-        else:
-            self.facing = 1
+        self.facing = 1 - 2 * (dx < 0)
 
         # --- Fire projectile ---
-        if distance <= self.attack_range * 1.2 and self.fire_timer >= self.fire_cooldown:
+        if distance <= attack_range * 1.2 and self.fire_timer >= self.fire_cooldown:
             self.fire_timer = 0.0
-            fire_spawn_pos = Vector(enemy_center.x - 80, enemy_center.y - 80)
+            fire_spawn_pos = Vector(center_x - 80, center_y - 80)
             projectile_to_spawn = EnemyProjectileEntity(
                 pos=fire_spawn_pos,
                 target_pos=self.target_pos,
                 fire_textures=self.fire_textures,
             )
 
-        self.pos.x = max(0, min(self.pos.x, bounds[0] - self.size[0]))
+        pos.x = max(0, min(pos.x, bounds[0] - self.size[0]))
         # Clamp Y to walkable band (same rule as player)
-        block_unit = bounds[1] / 10.0
-        min_y = block_unit
-        max_y = bounds[1] - (3 * block_unit) - self.size[1]
-        self.pos.y = max(min_y, min(self.pos.y, max(min_y, max_y)))
+        if self._cached_bounds is not bounds:
+            self._cache_walk_band(bounds)
+        pos.y = min(self._max_y_eff, max(self._min_y, pos.y))
 
-        frames = self.animations.get(self.current_anim, [])
-        if frames:
-            anim_speed = self.attack_anim_speed if self.current_anim == "attack" else self.animation_speed
-            self.frame_timer += dt
-            if self.frame_timer >= anim_speed:
-                self.frame_timer = 0.0
-                self.current_frame = (self.current_frame + 1) % len(frames)
+        if self._current_frames:
+            self._advance_frame(dt)
 
         return projectile_to_spawn
 
@@ -712,95 +972,45 @@ class SpecialEnemyEntity(Entity):
         target_y = self.target_pos.y
         return (center_x, center_y, target_x, target_y)
 
-    def get_hitbox(self) -> Tuple[float, float, float, float]:
-        bboxes = self.anim_bboxes.get(self.current_anim)
-        if not bboxes:
-            return (self.pos.x, self.pos.y, self.size[0], self.size[1])
-        bbox = bboxes[self.current_frame % len(bboxes)]
-        bx, by, bw, bh = bbox
-        offset_x = bx * self.size[0] if self.facing == 1 else (1 - (bx + bw)) * self.size[0]
-        offset_y = (1 - (by + bh)) * self.size[1]
-
-        shrink_scale = 0.8
-        raw_w = bw * self.size[0]
-        raw_h = bh * self.size[1]
-        hit_w = raw_w * shrink_scale
-        hit_h = raw_h * shrink_scale
-        inset_x = (raw_w - hit_w) / 2
-        inset_y = (raw_h - hit_h) / 2
-
-        return (
-            self.pos.x + offset_x + inset_x,
-            self.pos.y + offset_y + inset_y,
-            hit_w,
-            hit_h,
-        )
+    def _gorgon_attack_hitbox(self, hitbox) -> Tuple[float, float, float, float]:
+        hx, hy, hw, hh = hitbox
+        tail_w = hw * 0.22
+        tail_h = hh * 0.28
 
-    def get_attack_hitbox(self) -> Tuple[float, float, float, float]:
-        if self.current_anim != "attack":
-            return None
-
-        if "Kitsune" in self.asset_path:
-            return None
-
-        hx, hy, hw, hh = self.get_hitbox()
-
-        if "Gorgon" in self.asset_path:
-            tail_w = hw * 0.22
-            tail_h = hh * 0.28
+        if self.facing == 1:
+            tail_x = hx - (tail_w * 0.45)
+        else:
+            tail_x = hx + hw - (tail_w * 0.55)
 
-            if self.facing == 1:
-                tail_x = hx - (tail_w * 0.45)
-            else:
-                tail_x = hx + hw - (tail_w * 0.55)
+        tail_y = hy + hh * 0.18
+        return (tail_x, tail_y, tail_w, tail_h)
 
-            tail_y = hy + hh * 0.18
-            return (tail_x, tail_y, tail_w, tail_h)
+    def _werewolf_attack_hitbox(self, hitbox) -> Tuple[float, float, float, float]:
+        hx, hy, hw, hh = hitbox
+        hand_w = hw * 0.22
+        hand_h = hh * 0.22
 
-        if "Red_Werewolf" in self.asset_path:
-            hand_w = hw * 0.22
-            hand_h = hh * 0.22
+        if self.facing == 1:
+            hand_x = hx + hw - (hand_w * 0.35)
+        else:
+            hand_x = hx - (hand_w * 0.65)
 
-            if self.facing == 1:
-                hand_x = hx + hw - (hand_w * 0.35)
-            else:
-                hand_x = hx - (hand_w * 0.65)
+        hand_y = hy + hh * 0.4
+        return (hand_x, hand_y, hand_w, hand_h)
 
-            hand_y = hy + hh * 0.4
-            return (hand_x, hand_y, hand_w, hand_h)
+    # Skin folder name -> attack hitbox builder; Kitsune attacks only at range
+    ATTACK_HITBOX_FNS = {
+        "Gorgon": _gorgon_attack_hitbox,
+        "Red_Werewolf": _werewolf_attack_hitbox,
+    }
 
-        return None
+    def get_attack_hitbox(self) -> Tuple[float, float, float, float]:
+        if self.current_anim != "attack" or self._attack_hitbox_fn is None:
+            return None
+        hitbox = self.get_hitbox()
+        # get_hitbox returns the same tuple until frame, facing or position change
+        if hitbox is not self._attack_hitbox_src:
+            self._attack_hitbox_src = hitbox
+            self._attack_hitbox = self._attack_hitbox_fn(self, hitbox)
+        return self._attack_hitbox
 
-    def draw(self, canvas):
-        texture = self.animations.get(self.current_anim, [None])[self.current_frame]
-        if texture is None:
-            return
-        x, y = self.pos.x, self.pos.y
-        # Health bar based on hitbox
-        hit_x, hit_y, hit_w, hit_h = self.get_hitbox()
-        bar_width = hit_w
-        bar_height = 8
-        bar_x = hit_x
-        bar_y = hit_y + hit_h + 60  # สูงขึ้นอีก 50px
-        with canvas:
-            # Health bar background
-            Color(0.15, 0.15, 0.15, 0.7)
-            Rectangle(pos=(bar_x, bar_y), size=(bar_width, bar_height))
-            # Health bar foreground - purple
-            hp_ratio = max(0.0, min(1.0, self.hp / self.max_hp))
-            Color(0.7, 0.2, 1, 1)
-            Rectangle(pos=(bar_x, bar_y), size=(bar_width * hp_ratio, bar_height))
-
-            # Draw special enemy sprite with hit flash
-            if self.hit_flash_timer > 0:
-                Color(1, 0.3, 0.3, 1)  # red tint on hit
-            else:
-                Color(1, 1, 1, 1)
-            if self.facing == -1:
-                PushMatrix()
-                origin = (x + self.size[0] / 2, y + self.size[1] / 2)
-                Scale(x=-1, y=1, origin=origin)
-                Rectangle(texture=texture, pos=(x, y), size=self.size)
-                PopMatrix()
-            else:
-                Rectangle(texture=texture, pos=(x, y), size=self.size)
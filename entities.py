@@ -1,6 +1,6 @@
 from entity_base import Entity
 from projectile_entities import BulletEntity, EnemyProjectileEntity
-from player_entity import PlayerEntity
+from player_entity import PlayerEntity, KEY_UP, KEY_DOWN, KEY_LEFT, KEY_RIGHT, KEY_RUN, MOVE_KEY_BITS
 from enemy_entities import EnemyEntity, SpecialEnemyEntity
 
 __all__ = [
@@ -10,4 +10,10 @@ __all__ = [
     "EnemyEntity",
     "SpecialEnemyEntity",
     "EnemyProjectileEntity",
+    "KEY_UP",
+    "KEY_DOWN",
+    "KEY_LEFT",
+    "KEY_RIGHT",
+    "KEY_RUN",
+    "MOVE_KEY_BITS",
 ]
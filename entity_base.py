@@ -7,7 +7,7 @@ from kivy.vector import Vector
 from status_system import StatusComponent
 
 
-@dataclass
+@dataclass(slots=True)
 class Entity:
     pos: Vector
     size: Tuple[float, float]
@@ -1,18 +1,20 @@
-from typing import Set, List, Dict
+from typing import List, Dict
 import random
 import math
+import numpy as np
 from kivy.clock import Clock
 from kivy.app import App
 from kivy.core.window import Window
 from kivy.core.image import Image as CoreImage
 from kivy.core.audio import SoundLoader
-from kivy.graphics import Color, Rectangle, RoundedRectangle, Line, PushMatrix, PopMatrix, Rotate, Ellipse
+from kivy.graphics import Color, InstructionGroup, Rectangle, RoundedRectangle, Line, PushMatrix, PopMatrix, Rotate, Ellipse
 from kivy.uix.widget import Widget
 from kivy.uix.label import Label
 from kivy.vector import Vector
 from kivy.core.text import Label as CoreLabel
 
 from entities import PlayerEntity, BulletEntity, EnemyEntity, SpecialEnemyEntity, EnemyProjectileEntity
+from entities import KEY_DOWN, KEY_LEFT, KEY_RIGHT, KEY_UP, MOVE_KEY_BITS
 
 
 class ExpOrb:
@@ -24,35 +26,53 @@ class ExpOrb:
         self.size = 18
         self.base_pull_speed = 240
         self.max_pull_speed = 820
+        self._build_graphics()
 
     def get_hitbox(self):
         half = self.size / 2
         return (self.pos.x - half, self.pos.y - half, self.size, self.size)
 
     def update(self, dt: float, player_center: Vector, pull_radius: float):
-        direction = player_center - self.pos
-        distance = direction.length()
+        dx = player_center.x - self.pos.x
+        dy = player_center.y - self.pos.y
+        distance = math.hypot(dx, dy)
         if distance <= 0.001 or distance > pull_radius:
             return
 
         strength = 1.0 - (distance / pull_radius)
         pull_speed = self.base_pull_speed + (self.max_pull_speed - self.base_pull_speed) * strength
-        self.pos += direction.normalize() * (pull_speed * dt)
+        step = pull_speed * dt / distance
+        self.pos.x += dx * step
+        self.pos.y += dy * step
 
     def draw(self, canvas):
+        x = self.pos.x
+        y = self.pos.y
         half = self.size / 2
-        with canvas:
-            Color(0.25, 1.0, 0.3, 0.95)
-            PushMatrix()
-            Rotate(angle=45, origin=(self.pos.x, self.pos.y))
-            Rectangle(pos=(self.pos.x - half, self.pos.y - half), size=(self.size, self.size))
-            PopMatrix()
-
-            Color(0.85, 1.0, 0.88, 0.95)
-            PushMatrix()
-            Rotate(angle=45, origin=(self.pos.x, self.pos.y))
-            Rectangle(pos=(self.pos.x - half * 0.35, self.pos.y - half * 0.35), size=(self.size * 0.35, self.size * 0.35))
-            PopMatrix()
+        self._outer_rotate.origin = (x, y)
+        self._outer_rect.pos = (x - half, y - half)
+        self._inner_rotate.origin = (x, y)
+        self._inner_rect.pos = (x - half * 0.35, y - half * 0.35)
+        canvas.add(self._gfx)
+
+    def _build_graphics(self):
+        """Create the instructions reused by draw() every frame."""
+        self._gfx = InstructionGroup()
+        self._gfx.add(Color(0.25, 1.0, 0.3, 0.95))
+        self._gfx.add(PushMatrix())
+        self._outer_rotate = Rotate(angle=45)
+        self._gfx.add(self._outer_rotate)
+        self._outer_rect = Rectangle(size=(self.size, self.size))
+        self._gfx.add(self._outer_rect)
+        self._gfx.add(PopMatrix())
+
+        self._gfx.add(Color(0.85, 1.0, 0.88, 0.95))
+        self._gfx.add(PushMatrix())
+        self._inner_rotate = Rotate(angle=45)
+        self._gfx.add(self._inner_rotate)
+        self._inner_rect = Rectangle(size=(self.size * 0.35, self.size * 0.35))
+        self._gfx.add(self._inner_rect)
+        self._gfx.add(PopMatrix())
 
 
 class BossOrb:
@@ -63,29 +83,44 @@ class BossOrb:
         self.size = 34
         self.base_pull_speed = 210
         self.max_pull_speed = 720
+        self._build_graphics()
 
     def get_hitbox(self):
         half = self.size / 2
         return (self.pos.x - half, self.pos.y - half, self.size, self.size)
 
     def update(self, dt: float, player_center: Vector, pull_radius: float):
-        direction = player_center - self.pos
-        distance = direction.length()
+        dx = player_center.x - self.pos.x
+        dy = player_center.y - self.pos.y
+        distance = math.hypot(dx, dy)
         if distance <= 0.001 or distance > pull_radius:
             return
 
         strength = 1.0 - (distance / pull_radius)
         pull_speed = self.base_pull_speed + (self.max_pull_speed - self.base_pull_speed) * strength
-        self.pos += direction.normalize() * (pull_speed * dt)
+        step = pull_speed * dt / distance
+        self.pos.x += dx * step
+        self.pos.y += dy * step
 
     def draw(self, canvas):
+        x = self.pos.x
+        y = self.pos.y
         half = self.size / 2
-        with canvas:
-            Color(0.58, 0.22, 0.92, 0.95)
-            Ellipse(pos=(self.pos.x - half, self.pos.y - half), size=(self.size, self.size))
-            Color(0.9, 0.75, 1.0, 0.95)
-            inner = self.size * 0.42
-            Ellipse(pos=(self.pos.x - inner / 2, self.pos.y - inner / 2), size=(inner, inner))
+        inner = self.size * 0.42
+        self._outer.pos = (x - half, y - half)
+        self._inner.pos = (x - inner / 2, y - inner / 2)
+        canvas.add(self._gfx)
+
+    def _build_graphics(self):
+        """Create the instructions reused by draw() every frame."""
+        inner = self.size * 0.42
+        self._gfx = InstructionGroup()
+        self._gfx.add(Color(0.58, 0.22, 0.92, 0.95))
+        self._outer = Ellipse(size=(self.size, self.size))
+        self._gfx.add(self._outer)
+        self._gfx.add(Color(0.9, 0.75, 1.0, 0.95))
+        self._inner = Ellipse(size=(inner, inner))
+        self._gfx.add(self._inner)
 
 
 class HealthOrb:
@@ -99,6 +134,7 @@ class HealthOrb:
         self.size = 24
         self.base_pull_speed = 190
         self.max_pull_speed = 700
+        self._build_graphics()
 
     def get_hitbox(self):
         half = self.size / 2
@@ -107,26 +143,40 @@ class HealthOrb:
     def update(self, dt: float, player_center: Vector, pull_radius: float):
         self.age += dt
 
-        direction = player_center - self.pos
-        distance = direction.length()
+        dx = player_center.x - self.pos.x
+        dy = player_center.y - self.pos.y
+        distance = math.hypot(dx, dy)
         if distance <= 0.001 or distance > pull_radius:
             return
 
         strength = 1.0 - (distance / pull_radius)
         pull_speed = self.base_pull_speed + (self.max_pull_speed - self.base_pull_speed) * strength
-        self.pos += direction.normalize() * (pull_speed * dt)
+        step = pull_speed * dt / distance
+        self.pos.x += dx * step
+        self.pos.y += dy * step
 
     def is_expired(self) -> bool:
         return self.age >= self.lifetime
 
     def draw(self, canvas):
+        x = self.pos.x
+        y = self.pos.y
         half = self.size / 2
-        with canvas:
-            Color(0.95, 0.22, 0.28, 0.95)
-            Ellipse(pos=(self.pos.x - half, self.pos.y - half), size=(self.size, self.size))
-            Color(1.0, 0.78, 0.82, 0.95)
-            inner = self.size * 0.42
-            Ellipse(pos=(self.pos.x - inner / 2, self.pos.y - inner / 2), size=(inner, inner))
+        inner = self.size * 0.42
+        self._outer.pos = (x - half, y - half)
+        self._inner.pos = (x - inner / 2, y - inner / 2)
+        canvas.add(self._gfx)
+
+    def _build_graphics(self):
+        """Create the instructions reused by draw() every frame."""
+        inner = self.size * 0.42
+        self._gfx = InstructionGroup()
+        self._gfx.add(Color(0.95, 0.22, 0.28, 0.95))
+        self._outer = Ellipse(size=(self.size, self.size))
+        self._gfx.add(self._outer)
+        self._gfx.add(Color(1.0, 0.78, 0.82, 0.95))
+        self._inner = Ellipse(size=(inner, inner))
+        self._gfx.add(self._inner)
 
 
 class GrenadeEntity:
@@ -182,9 +232,9 @@ class GrenadeEntity:
                 self.frame_timer = 0.0
                 self.current_frame = (self.current_frame + 1) % len(self.textures)
         if self.time_left > 0:
-            to_target = self.target_pos - self.pos
-            if to_target.length() > 8:
-                self.pos += self.velocity * dt
+            if math.hypot(self.target_pos.x - self.pos.x, self.target_pos.y - self.pos.y) > 8:
+                self.pos.x += self.velocity.x * dt
+                self.pos.y += self.velocity.y * dt
 
     def get_hitbox(self):
         half = self.hitbox_size / 2
@@ -298,6 +348,7 @@ class ExplosionEffect:
 class GameWidget(Widget):
     MAX_ENEMIES = 100  # Limit to prevent lag
     GAME_DURATION = 15 * 60  # 15 minutes in seconds
+    DEBUG_LABEL_INTERVAL = 0.25  # Seconds between debug overlay text refreshes
     STATE_LOADING = "LOADING"
     STATE_MAIN_MENU = "MAIN_MENU"
     STATE_PLAYING = "PLAYING"
@@ -309,10 +360,19 @@ class GameWidget(Widget):
     def __init__(self, **kwargs):
         initial_state = kwargs.pop("initial_state", self.STATE_LOADING)
         super().__init__(**kwargs)
-
-        # Preload all enemy textures at startup to avoid runtime lag
-        EnemyEntity.preload_all_skins()
-        SpecialEnemyEntity.preload_all_skins()
+        # Replaced only on resize, so entities can cache bounds-derived limits by identity
+        self._bounds = (self.width, self.height)
+
+        # Preload all enemy textures at startup to avoid runtime lag. Behind the
+        # loading screen the PNG decode runs on a worker thread instead.
+        self._pending_skin_preloads = 0
+        if initial_state == self.STATE_LOADING:
+            self._pending_skin_preloads = 2
+            EnemyEntity.preload_all_skins_async(self._on_skins_preloaded)
+            SpecialEnemyEntity.preload_all_skins_async(self._on_skins_preloaded)
+        else:
+            EnemyEntity.preload_all_skins()
+            SpecialEnemyEntity.preload_all_skins()
 
         self.player = PlayerEntity(pos=Vector(0, 0))
         self._did_initial_player_center = False
@@ -393,10 +453,15 @@ class GameWidget(Widget):
         self.ui_textures = self._load_ui_textures()
         
         self.bg_texture = CoreImage("game_picture/background/bg2.png").texture
+        self._scene_bg = InstructionGroup()
+        self._scene_bg.add(Color(1, 1, 1, 1))
+        self._scene_bg_rect = Rectangle(texture=self.bg_texture, pos=(0, 0), size=self.size)
+        self._scene_bg.add(self._scene_bg_rect)
         self.menu_bg_texture = self._load_texture("game_picture/background/bg1.png") or self.bg_texture
         self._keyboard = Window.request_keyboard(self._on_keyboard_closed, self)
         self._keyboard.bind(on_key_down=self._on_key_down, on_key_up=self._on_key_up)
-        self.pressed_keys: Set[str] = set()
+        # Held movement keys packed as player_entity KEY_* bits
+        self.move_key_bits = 0
         
         # Labels for UI
         self.debug_label = Label(text="", pos=(10, 10), halign="left", valign="bottom")
@@ -413,6 +478,10 @@ class GameWidget(Widget):
         self.add_widget(self.progression_label)
         
         self.debug_mode = False
+        self._debug_label_next = 0.0
+        # Color/Line instructions reused by the debug overlay every frame
+        self._debug_pools: Dict[str, List] = {"color": [], "rectangle": [], "circle": [], "points": []}
+        self._debug_pool_used: Dict[str, int] = {}
         self.god_mode = False  # Player invincibility (debug key 8)
         self.bullet_damage = self.player.bullet_damage
         self.fire_rate = self.player.fire_rate
@@ -752,7 +821,7 @@ class GameWidget(Widget):
             self.firing = False
             self.left_mouse_held = False
             self.burst_shots_remaining = 0
-            self.pressed_keys.clear()
+            self.move_key_bits = 0
             self.player.stop_shooting()
 
     def _return_to_main_menu(self):
@@ -884,13 +953,13 @@ class GameWidget(Widget):
             self._cycle_balance_preset()
             return True
 
-        self.pressed_keys.add(key)
+        self.move_key_bits |= MOVE_KEY_BITS.get(key, 0)
         return True
 
     def _on_key_up(self, keyboard, keycode):
         if self.game_state != self.STATE_PLAYING:
             return True
-        self.pressed_keys.discard(keycode[1])
+        self.move_key_bits &= ~MOVE_KEY_BITS.get(keycode[1], 0)
         return True
 
     def on_touch_down(self, touch):
@@ -1047,7 +1116,7 @@ class GameWidget(Widget):
             self.loading_progress = min(1.0, self.loading_progress + (dt / max(0.1, self.loading_duration)))
             self._draw_loading_screen()
             self._update_debug(0.0)
-            if self.loading_progress >= 1.0:
+            if self.loading_progress >= 1.0 and self._pending_skin_preloads == 0:
                 self._set_state(self.STATE_MAIN_MENU)
             return
 
@@ -1120,7 +1189,7 @@ class GameWidget(Widget):
         self._apply_time_scaled_balance()
         self._update_progression_hud()
 
-        self.player.update(dt, self.pressed_keys, (self.width, self.height))
+        self.player.update(dt, self.move_key_bits, self._bounds)
         self._update_dodge_state(dt)
 
         if self.player.is_dead:
@@ -1137,12 +1206,13 @@ class GameWidget(Widget):
             
             for enemy in self.enemies[:]:
                 if enemy.is_dying:
-                    enemy.update(dt, Vector(0, 0), (self.width, self.height))
+                    enemy.update(dt, Vector(0, 0), self._bounds)
                     if enemy.death_anim_done:
                         self.enemies.remove(enemy)
+                        EnemyEntity.release(enemy)
             for se in self.special_enemies[:]:
                 if se.is_dying:
-                    se.update(dt, Vector(0, 0), (self.width, self.height))
+                    se.update(dt, Vector(0, 0), self._bounds)
                     if se.death_anim_done:
                         self.special_enemies.remove(se)
             if self.death_screen_timer >= self.death_screen_delay:
@@ -1180,28 +1250,29 @@ class GameWidget(Widget):
         player_center = Vector(pbox[0] + pbox[2] / 2, pbox[1] + pbox[3] / 2)
         enemy_dt = dt * self.enemy_speed_multiplier
         
-        for enemy in self.enemies[:]:
-            enemy.update(enemy_dt, player_center, (self.width, self.height))
+        EnemyEntity.update_all(self.enemies, enemy_dt, player_center, self._bounds)
+        for enemy in self.enemies:
             if not enemy.is_dying:
                 self._update_enemy_state(enemy)
 
         for special_enemy in self.special_enemies[:]:
             if not special_enemy.is_dying:
-                projectile = special_enemy.update(enemy_dt, player_center, (self.width, self.height), bullets=self.bullets)
+                projectile = special_enemy.update(enemy_dt, player_center, self._bounds, bullets=self.bullets)
                 if projectile:
                     self.enemy_projectiles.append(projectile)
                 self._update_enemy_state(special_enemy)
             else:
-                special_enemy.update(enemy_dt, player_center, (self.width, self.height))
+                special_enemy.update(enemy_dt, player_center, self._bounds)
 
         self._separate_enemies()
 
         height = self.height if self.height > 0 else Window.height
         block_unit = height / 10.0
         walk_min_y = block_unit
+        walk_top = height - (3 * block_unit)
         for e in self.enemies + self.special_enemies:
-            walk_max_y = height - (3 * block_unit) - e.size[1]
-            e.pos.y = max(walk_min_y, min(e.pos.y, max(walk_min_y, walk_max_y)))
+            walk_max_y = max(walk_min_y, walk_top - e.size[1])
+            e.pos.y = min(walk_max_y, max(walk_min_y, e.pos.y))
 
         self.fire_timer += dt
         if self.firing and not self.player.is_dead:
@@ -1227,40 +1298,46 @@ class GameWidget(Widget):
                 self.firing = False
                 self.burst_shots_remaining = 0
         
-        for b in self.bullets[:]:
+        # Enemies don't move while bullets resolve, so test every bullet against one
+        # snapshot of the live hitboxes (regular enemies first, then specials)
+        targets = [e for e in self.enemies if not e.is_dying]
+        targets += [se for se in self.special_enemies if not se.is_dying]
+        if targets:
+            target_boxes = np.array([t.get_hitbox() for t in targets], dtype=np.float64)
+            target_left = target_boxes[:, 0]
+            target_bottom = target_boxes[:, 1]
+            target_right = target_left + target_boxes[:, 2]
+            target_top = target_bottom + target_boxes[:, 3]
+            target_alive = np.ones(len(targets), dtype=bool)
+
+        # Survivors are collected in one pass instead of list.remove() per spent bullet
+        live_bullets = []
+        max_x = self.width + 50
+        max_y = self.height + 50
+        for b in self.bullets:
             b.update(dt)
-            if b.pos.x < -50 or b.pos.x > self.width + 50 or b.pos.y < -50 or b.pos.y > self.height + 50:
-                self.bullets.remove(b)
+            pos = b.pos
+            if pos.x < -50 or pos.x > max_x or pos.y < -50 or pos.y > max_y:
                 continue
-            bullet_box = b.get_hitbox()
-            hit = False
-            for enemy in self.enemies[:]:
-                if enemy.is_dying: 
-                    continue
-                if self._rects_intersect(bullet_box, enemy.get_hitbox()):
-                    bullet_damage = getattr(b, "damage", self.bullet_damage)
-                    enemy_died = enemy.take_damage(bullet_damage)
-                    self._apply_lifesteal(bullet_damage)
-                    self.play_sound("enemy_hit")
-                    if enemy_died: 
-                        self._handle_enemy_kill(enemy)
-                    hit = True
-                    break
-            if not hit:
-                for se in self.special_enemies[:]:
-                    if se.is_dying: 
-                        continue
-                    if self._rects_intersect(bullet_box, se.get_hitbox()):
-                        bullet_damage = getattr(b, "damage", self.bullet_damage)
-                        enemy_died = se.take_damage(bullet_damage)
-                        self._apply_lifesteal(bullet_damage)
-                        self.play_sound("enemy_hit")
-                        if enemy_died: 
-                            self._handle_enemy_kill(se)
-                        hit = True
-                        break
-            if hit and b in self.bullets:
-                self.bullets.remove(b)
+            if not targets:
+                live_bullets.append(b)
+                continue
+            # Same inclusive overlap test as _rects_intersect, against every target at once
+            bx, by, bw, bh = b.get_hitbox()
+            hits = target_alive & (target_right >= bx) & (target_left <= bx + bw) & (target_top >= by) & (target_bottom <= by + bh)
+            if not hits.any():
+                live_bullets.append(b)
+                continue
+            idx = int(hits.argmax())
+            enemy = targets[idx]
+            bullet_damage = getattr(b, "damage", self.bullet_damage)
+            enemy_died = enemy.take_damage(bullet_damage)
+            self._apply_lifesteal(bullet_damage)
+            self.play_sound("enemy_hit")
+            if enemy_died:
+                target_alive[idx] = False
+                self._handle_enemy_kill(enemy)
+        self.bullets = live_bullets
 
         for grenade in self.grenades[:]:
             grenade.update(dt)
@@ -1361,12 +1438,18 @@ class GameWidget(Widget):
                         self.player_hit_flash = 0.0
                     self.player_hit_flash = 0.3
 
+        for enemy in self.enemies:
+            if enemy.death_anim_done:
+                EnemyEntity.release(enemy)
         self.enemies = [e for e in self.enemies if not e.death_anim_done]
         self.special_enemies = [e for e in self.special_enemies if not e.death_anim_done]
 
         self._draw_scene()
         self._update_debug(dt)
 
+    def _on_skins_preloaded(self):
+        self._pending_skin_preloads -= 1
+
     def _update_enemy_state(self, enemy):
         """Trigger attack animation when enemy's attack hitbox (hand/tail) touches player."""
         if enemy.is_dying:
@@ -1375,21 +1458,21 @@ class GameWidget(Widget):
             enemy.is_attacking = False
         
         pbox = self.player.get_hitbox()
-        enemy_center = Vector(enemy.pos.x + enemy.size[0] / 2, enemy.pos.y + enemy.size[1] / 2)
-        player_center = Vector(pbox[0] + pbox[2] / 2, pbox[1] + pbox[3] / 2)
-        distance = (player_center - enemy_center).length()
+        dx = (pbox[0] + pbox[2] / 2) - (enemy.pos.x + enemy.size[0] / 2)
+        dy = (pbox[1] + pbox[3] / 2) - (enemy.pos.y + enemy.size[1] / 2)
+        distance_sq = dx * dx + dy * dy
         
         attack_enter_distance = getattr(enemy, 'attack_enter_dist', 150)
         attack_exit_distance = getattr(enemy, 'attack_exit_dist', 200)
         
         if enemy.is_attacking:
-            if distance > attack_exit_distance:
+            if distance_sq > attack_exit_distance * attack_exit_distance:
                 enemy.is_attacking = False
                 self._set_enemy_anim(enemy, "walk")
             else:
                 self._set_enemy_anim(enemy, "attack")
         else:
-            if distance < attack_enter_distance:
+            if distance_sq < attack_enter_distance * attack_enter_distance:
                 enemy.is_attacking = True
                 self._set_enemy_anim(enemy, "attack")
             else:
@@ -1426,10 +1509,9 @@ class GameWidget(Widget):
                             self._push_apart(e1, e2)
 
     def _push_apart(self, e1, e2):
-        c1 = e1.pos + Vector(e1.size[0] / 2, e1.size[1] / 2)
-        c2 = e2.pos + Vector(e2.size[0] / 2, e2.size[1] / 2)
-        delta = c2 - c1
-        dist = delta.length()
+        dx = (e2.pos.x + e2.size[0] / 2) - (e1.pos.x + e1.size[0] / 2)
+        dy = (e2.pos.y + e2.size[1] / 2) - (e1.pos.y + e1.size[1] / 2)
+        dist = math.hypot(dx, dy)
 
         r1 = getattr(e1, "separation_radius", min(e1.size[0], e1.size[1]) * 0.24)
         r2 = getattr(e2, "separation_radius", min(e2.size[0], e2.size[1]) * 0.24)
@@ -1439,15 +1521,18 @@ class GameWidget(Widget):
             return
 
         if dist < 0.001:
-            delta = Vector(1, 0)
+            dx, dy = 1.0, 0.0
             dist = 1.0
 
         overlap = min_dist - dist
         soft_factor = 0.50
         push = overlap * 0.5 * soft_factor
-        move = delta.normalize() * push
-        e1.pos -= move
-        e2.pos += move
+        move_x = dx / dist * push
+        move_y = dy / dist * push
+        e1.pos.x -= move_x
+        e1.pos.y -= move_y
+        e2.pos.x += move_x
+        e2.pos.y += move_y
 
     def _get_enemy_render_order(self):
         """Render order: danger first to front, then Y-sort, then stable spawn tie-break."""
@@ -1481,18 +1566,17 @@ class GameWidget(Widget):
 
     def _draw_scene(self):
         self.canvas.clear()
+        # The backdrop is one retained group; only its size can change between frames
+        self._scene_bg_rect.size = self.size
+        self.canvas.add(self._scene_bg)
         with self.canvas:
-            Color(1, 1, 1, 1)
-            Rectangle(texture=self.bg_texture, pos=(0, 0), size=self.size)
-
             self.player.draw(self.canvas)
             Color(1, 1, 1, 1)
 
             for enemy in self._get_enemy_render_order():
                 enemy.draw(self.canvas)
 
-            for b in self.bullets:
-                b.draw(self.canvas)
+            BulletEntity.draw_all(self.bullets, self.canvas)
 
             for grenade in self.grenades:
                 grenade.draw(self.canvas)
@@ -1523,65 +1607,91 @@ class GameWidget(Widget):
             if self.boss_upgrade_active:
                 self._draw_boss_upgrade_overlay()
 
-            if self.debug_mode and self.game_state == self.STATE_PLAYING:
-                Color(1, 0, 0, 0.8)
-                hx, hy, hw, hh = self.player.get_hitbox()
-                Line(rectangle=(hx, hy, hw, hh), width=2)
-
-                Color(0, 1, 0, 0.8)
-                for b in self.bullets:
-                    bx, by, bw, bh = b.get_hitbox()
-                    Line(rectangle=(bx, by, bw, bh), width=1)
-
-                Color(1, 0.5, 0, 0.8)
-                for proj in self.enemy_projectiles:
-                    px, py, pw, ph = proj.get_hitbox()
-                    Line(rectangle=(px, py, pw, ph), width=1)
-
-                Color(0.2, 1, 0.3, 0.85)
-                for orb in self.exp_orbs:
-                    ox, oy, ow, oh = orb.get_hitbox()
-                    Line(rectangle=(ox, oy, ow, oh), width=1)
-                Color(0.2, 1, 0.3, 0.25)
-                pbox = self.player.get_hitbox()
-                center_x = pbox[0] + pbox[2] / 2
-                center_y = pbox[1] + pbox[3] / 2
-                Line(circle=(center_x, center_y, self._get_exp_pull_radius()), width=1)
-
-                Color(0, 0, 1, 0.8)
-                for enemy in self.enemies:
-                    ex, ey, ew, eh = enemy.get_hitbox()
-                    Line(rectangle=(ex, ey, ew, eh), width=2)
-                    attack_box = enemy.get_attack_hitbox()
-                    if attack_box:
-                        Color(1, 1, 0, 0.8)
-                        ax, ay, aw, ah = attack_box
-                        Line(rectangle=(ax, ay, aw, ah), width=2)
-                        Color(0, 0, 1, 0.8)
-
-                Color(1, 0, 1, 0.8)
-                for special_enemy in self.special_enemies:
-                    ex, ey, ew, eh = special_enemy.get_hitbox()
-                    Line(rectangle=(ex, ey, ew, eh), width=2)
-                    attack_box = special_enemy.get_attack_hitbox()
-                    if attack_box:
-                        Color(1, 0.5, 0, 0.8)
-                        ax, ay, aw, ah = attack_box
-                        Line(rectangle=(ax, ay, aw, ah), width=2)
-                        Color(1, 0, 1, 0.8)
-
-                Color(1, 1, 0, 0.8)
-                for enemy in self.enemies:
-                    px1, py1, px2, py2 = enemy.get_path_points()
-                    Line(points=[px1, py1, px2, py2], width=2)
-
-                Color(0, 1, 1, 0.8)
-                for special_enemy in self.special_enemies:
-                    px1, py1, px2, py2 = special_enemy.get_path_points()
-                    Line(points=[px1, py1, px2, py2], width=2)
-
+        if self.debug_mode and self.game_state == self.STATE_PLAYING:
+            self._draw_debug_hitboxes()
+            with self.canvas:
                 self._draw_debug_entity_stats()
 
+    def _draw_debug_hitboxes(self):
+        """Outline hitboxes, attack boxes and enemy paths with pooled Color/Line instructions."""
+        self._debug_pool_used = dict.fromkeys(self._debug_pools, 0)
+        debug_color = self._debug_color
+        debug_line = self._debug_line
+
+        debug_color(1, 0, 0, 0.8)
+        debug_line("rectangle", self.player.get_hitbox(), 2)
+
+        debug_color(0, 1, 0, 0.8)
+        for b in self.bullets:
+            debug_line("rectangle", b.get_hitbox(), 1)
+
+        debug_color(1, 0.5, 0, 0.8)
+        for proj in self.enemy_projectiles:
+            debug_line("rectangle", proj.get_hitbox(), 1)
+
+        debug_color(0.2, 1, 0.3, 0.85)
+        for orb in self.exp_orbs:
+            debug_line("rectangle", orb.get_hitbox(), 1)
+        debug_color(0.2, 1, 0.3, 0.25)
+        pbox = self.player.get_hitbox()
+        center_x = pbox[0] + pbox[2] / 2
+        center_y = pbox[1] + pbox[3] / 2
+        debug_line("circle", (center_x, center_y, self._get_exp_pull_radius()), 1)
+
+        debug_color(0, 0, 1, 0.8)
+        for enemy in self.enemies:
+            debug_line("rectangle", enemy.get_hitbox(), 2)
+            attack_box = enemy.get_attack_hitbox()
+            if attack_box:
+                debug_color(1, 1, 0, 0.8)
+                debug_line("rectangle", attack_box, 2)
+                debug_color(0, 0, 1, 0.8)
+
+        debug_color(1, 0, 1, 0.8)
+        for special_enemy in self.special_enemies:
+            debug_line("rectangle", special_enemy.get_hitbox(), 2)
+            attack_box = special_enemy.get_attack_hitbox()
+            if attack_box:
+                debug_color(1, 0.5, 0, 0.8)
+                debug_line("rectangle", attack_box, 2)
+                debug_color(1, 0, 1, 0.8)
+
+        debug_color(1, 1, 0, 0.8)
+        for enemy in self.enemies:
+            debug_line("points", enemy.get_path_points(), 2)
+
+        debug_color(0, 1, 1, 0.8)
+        for special_enemy in self.special_enemies:
+            debug_line("points", special_enemy.get_path_points(), 2)
+
+    def _debug_color(self, r: float, g: float, b: float, a: float):
+        """Add the next pooled Color to the canvas (see _draw_debug_hitboxes)."""
+        pool = self._debug_pools["color"]
+        index = self._debug_pool_used["color"]
+        if index == len(pool):
+            pool.append(Color())
+        self._debug_pool_used["color"] = index + 1
+        color = pool[index]
+        color.rgba = (r, g, b, a)
+        self.canvas.add(color)
+
+    def _debug_line(self, mode: str, shape, width: float):
+        """Add the next pooled Line, set through its ``mode`` property, to the canvas.
+
+        Each mode keeps its own pool so a Line never switches between
+        rectangle, circle and point-list geometry.
+        """
+        pool = self._debug_pools[mode]
+        index = self._debug_pool_used[mode]
+        if index == len(pool):
+            pool.append(Line(width=width, **{mode: shape}))
+        else:
+            line = pool[index]
+            line.width = width
+            setattr(line, mode, shape)
+        self._debug_pool_used[mode] = index + 1
+        self.canvas.add(pool[index])
+
     def _draw_debug_entity_stats(self):
         """Draw HP / DMG / SPD / Cooldown text above each entity in debug mode."""
         phx, phy, phw, phh = self.player.get_hitbox()
@@ -2173,8 +2283,16 @@ class GameWidget(Widget):
         """Technical debug info update."""
         if not self.debug_mode:
             self.debug_label.text = ""
+            self._debug_label_next = 0.0
             return
-            
+
+        # Every text change re-renders the label texture, and the counts change almost every frame.
+        # Throttle on wall-clock time: dt is 0 outside PLAYING and scaled by time_speed_multiplier inside it.
+        now = Clock.get_boottime()
+        if now < self._debug_label_next:
+            return
+        self._debug_label_next = now + self.DEBUG_LABEL_INTERVAL
+
         fps = Clock.get_fps() or 0
         info = (
             f"FPS: {fps:.1f}\n"
@@ -2656,15 +2774,11 @@ class GameWidget(Widget):
             self._start_skill_cooldown(skill_id)
 
     def _cast_dodge(self) -> bool:
-        move_vec = Vector(0, 0)
-        if "w" in self.pressed_keys:
-            move_vec += Vector(0, 1)
-        if "s" in self.pressed_keys:
-            move_vec += Vector(0, -1)
-        if "a" in self.pressed_keys:
-            move_vec += Vector(-1, 0)
-        if "d" in self.pressed_keys:
-            move_vec += Vector(1, 0)
+        bits = self.move_key_bits
+        move_vec = Vector(
+            bool(bits & KEY_RIGHT) - bool(bits & KEY_LEFT),
+            bool(bits & KEY_UP) - bool(bits & KEY_DOWN),
+        )
 
         if move_vec.length() <= 0:
             move_vec = Vector(self.player.facing, 0)
@@ -2892,7 +3006,7 @@ class GameWidget(Widget):
         enemy_width = self.player.size[0]
         x_pos = self._get_enemy_offscreen_x(enemy_width, spawn_left)
 
-        self.enemies.append(EnemyEntity(
+        self.enemies.append(EnemyEntity.acquire(
             pos=Vector(x_pos, y_pos),
             player_size=self.player.size,
             scale_to_player=1.0
@@ -2959,7 +3073,8 @@ class GameWidget(Widget):
         return base
 
     def on_size(self, *args):
+        self._bounds = (self.width, self.height)
         if not self._did_initial_player_center and self.width > 0 and self.height > 0:
             self._spawn_player_at_screen_center()
             self._did_initial_player_center = True
-        self.player.update(0, set(), (self.width, self.height))
\ No newline at end of file
+        self.player.update(0, 0, (self.width, self.height))
\ No newline at end of file
@@ -1,29 +1,91 @@
+import math
 from typing import Dict, List, Optional, Tuple
 
+import numpy as np
 from kivy.core.image import Image as CoreImage
 from kivy.core.window import Window
-from kivy.graphics import Color, PopMatrix, PushMatrix, Rectangle, Scale
+from kivy.graphics import Color, InstructionGroup, Rectangle
 from kivy.vector import Vector
 
 from entity_base import Entity
+from sprite_assets import (
+    compute_alpha_bbox,
+    decode_images,
+    flip_tex_coords_horizontal,
+    get_cached_bbox,
+    hitbox_params,
+    pack_textures,
+    scale_hitbox_params,
+    save_bbox_cache,
+    shared_pixel_reads,
+    store_bbox,
+)
+
+# Held-key bits passed to PlayerEntity.update (kept in sync by the input handler)
+KEY_UP = 1
+KEY_DOWN = 2
+KEY_LEFT = 4
+KEY_RIGHT = 8
+KEY_RUN = 16
+MOVE_KEY_BITS = {"w": KEY_UP, "s": KEY_DOWN, "a": KEY_LEFT, "d": KEY_RIGHT, "shift": KEY_RUN}
 
 
 class PlayerEntity(Entity):
     """Sprite-based player that supports idle/walk/run and a specific shot sequence."""
+    __slots__ = (
+        "asset_path", "animations", "anim_hit_params", "max_hp", "hp",
+        "max_ammo", "ammo", "is_reloading", "base_reload_time", "reload_time", "reload_timer",
+        "firing_modes", "current_firing_mode_idx",
+        "level", "exp", "next_exp", "stat_points", "str", "dex", "agi", "int", "vit", "luck",
+        "base_walk_speed", "base_run_speed", "base_bullet_damage", "base_fire_rate",
+        "base_crit_chance", "base_max_hp", "bullet_damage", "fire_rate", "crit_chance",
+        "loot_drop_multiplier", "skill_cooldown_multiplier", "speed", "run_speed",
+        "_hit_rows", "_current_anim", "_current_frames", "_frame_count", "_current_hit_rows",
+        "current_frame", "frame_timer", "animation_speed", "facing",
+        "is_shooting", "is_hurt", "hurt_timer", "hurt_duration", "hit_flash_timer",
+        "is_dead", "death_anim_done",
+        "_cached_bounds", "_max_x", "_min_y", "_max_y", "_hitbox_key", "_hitbox",
+        "_gfx", "_bar_bg", "_bar_color", "_bar_fill", "_tint", "_sprite", "_cur_texture", "_cur_facing",
+    )
     DESIGN_HEIGHT = 1080
+    HITBOX_SHRINK = 0.82
+    # (animation name, file prefix, frame count)
+    ANIMATION_SPECS = (
+        ("idle", "Idle", 7),
+        ("walk", "Walk", 7),
+        ("run", "Run", 8),
+        ("shot", "Shot_", 5),
+        ("hurt", "Hurt", 3),
+        ("dead", "Dead", 4),
+        ("recharge", "Recharge", 13),
+    )
+
+    # asset_path -> (animations, anim_hit_params), shared by every player built from that skin
+    _animation_cache: Dict[str, Tuple[Dict[str, List], Dict[str, np.ndarray]]] = {}
 
     def __init__(self, pos: Vector, asset_path: str = "game_picture/player/Soldier_1"):
         self.asset_path = asset_path
-        self.animations: Dict[str, List] = {}
-        self.anim_bboxes: Dict[str, List[Tuple[float, float, float, float]]] = {}
-
-        self._load_animation("idle", "Idle", 7)
-        self._load_animation("walk", "Walk", 7)
-        self._load_animation("run", "Run", 8)
-        self._load_animation("shot", "Shot_", 5)
-        self._load_animation("hurt", "Hurt", 3)
-        self._load_animation("dead", "Dead", 4)
-        self._load_animation("recharge", "Recharge", 13)
+        cached = PlayerEntity._animation_cache.get(asset_path)
+        if cached is not None:
+            self.animations, self.anim_hit_params = cached
+        else:
+            self.animations: Dict[str, List] = {}
+            # (frames, 5) float32 per animation, see hitbox_params
+            self.anim_hit_params: Dict[str, np.ndarray] = {}
+
+            paths = [
+                f"{asset_path}/{prefix}{idx}.png"
+                for _name, prefix, count in self.ANIMATION_SPECS
+                for idx in range(1, count + 1)
+            ]
+            # Decode and scan uncached bboxes on a thread pool; only texture upload stays here
+            decoded = decode_images(paths, bbox_paths=paths)
+            with shared_pixel_reads():
+                for name, prefix, count in self.ANIMATION_SPECS:
+                    self._load_animation(name, prefix, count, decoded)
+                save_bbox_cache()
+                self._pack_into_atlas()
+            PlayerEntity._animation_cache[asset_path] = (self.animations, self.anim_hit_params)
 
         base_texture = self.animations["idle"][0]
         target_height = self.DESIGN_HEIGHT / 3
@@ -32,6 +94,7 @@ class PlayerEntity(Entity):
         height = base_texture.height * scale
 
         super().__init__(pos=pos, size=(width, height), color=(1, 1, 1))
+        self._hit_rows = scale_hitbox_params(self.anim_hit_params, width, height)
 
         # Health system
         self.max_hp = 100
@@ -88,8 +151,24 @@ class PlayerEntity(Entity):
         self.hurt_duration = 0.3
         self.death_anim_done = False
         self.hit_flash_timer = 0.0
+        self._cached_bounds = None
+        self._hitbox_key = None
+        self._hitbox = None
 
         self.recalculate_derived_stats()
+        self._build_graphics()
+
+    @property
+    def current_anim(self) -> str:
+        return self._current_anim
+
+    @current_anim.setter
+    def current_anim(self, value: str):
+        # Cache the per-animation lookups so update/get_hitbox/draw skip the dict hashes.
+        self._current_anim = value
+        self._current_frames = self.animations.get(value, [])
+        self._frame_count = len(self._current_frames)
+        self._current_hit_rows = self._hit_rows.get(value)
 
     @property
     def firing_mode(self) -> str:
@@ -172,44 +251,41 @@ class PlayerEntity(Entity):
             if self.ammo <= 0:
                 self.start_reload()
 
-    def _load_animation(self, name: str, prefix: str, count: int):
+    def _load_animation(self, name: str, prefix: str, count: int, decoded=None):
         frames: List = []
         bboxes: List[Tuple[float, float, float, float]] = []
         for idx in range(1, count + 1):
             path = f"{self.asset_path}/{prefix}{idx}.png"
             try:
-                texture = CoreImage(path).texture
+                image = decoded.get(path) if decoded else None
+                texture = image.texture if image is not None else CoreImage(path).texture
                 frames.append(texture)
-                bboxes.append(self._compute_bbox(texture))
+                bbox = get_cached_bbox(path)
+                if bbox is None:
+                    bbox = compute_alpha_bbox(texture)
+                    store_bbox(path, bbox)
+                bboxes.append(bbox)
             except Exception as exc:
                 pass
         if frames:
             self.animations[name] = frames
-            self.anim_bboxes[name] = bboxes
-
-    def _compute_bbox(self, texture) -> Tuple[float, float, float, float]:
-        w, h = texture.size
-        pixels = texture.pixels
-        min_x, min_y = w, h
-        max_x, max_y = -1, -1
-        for y in range(h):
-            row_start = y * w * 4
-            for x in range(w):
-                alpha = pixels[row_start + x * 4 + 3]
-                if alpha > 10:
-                    if x < min_x:
-                        min_x = x
-                    if y < min_y:
-                        min_y = y
-                    if x > max_x:
-                        max_x = x
-                    if y > max_y:
-                        max_y = y
-        if max_x == -1:
-            return (0.0, 0.0, 1.0, 1.0)
-        return (min_x / w, min_y / h, (max_x - min_x + 1) / w, (max_y - min_y + 1) / h)
-
-    def update(self, dt: float, pressed_keys: set, bounds: Tuple[float, float]):
+            self.anim_hit_params[name] = hitbox_params(bboxes, self.HITBOX_SHRINK)
+
+    def _pack_into_atlas(self):
+        """Swap the loaded frames for regions of a shared atlas texture."""
+        regions = iter(pack_textures([frame for frames in self.animations.values() for frame in frames]))
+        for frames in self.animations.values():
+            frames[:] = [next(regions) for _ in frames]
+
+    def _cache_walk_band(self, bounds: Tuple[float, float]):
+        """Recompute the x limit and walkable y-range for ``bounds``."""
+        block_unit = bounds[1] / 10.0
+        self._max_x = max(0, bounds[0] - self.size[0])
+        self._min_y = block_unit
+        self._max_y = bounds[1] - (3 * block_unit) - self.size[1]
+        self._cached_bounds = bounds
+
+    def update(self, dt: float, key_bits: int, bounds: Tuple[float, float]):
         self.update_statuses(dt)
 
         if self.is_reloading:
@@ -223,7 +299,7 @@ class PlayerEntity(Entity):
                 self.current_anim = "dead"
                 self.current_frame = 0
                 self.frame_timer = 0.0
-            frames = self.animations.get("dead", [])
+            frames = self._current_frames
             if frames and not self.death_anim_done:
                 self.frame_timer += dt
                 if self.frame_timer >= self.animation_speed:
@@ -242,70 +318,75 @@ class PlayerEntity(Entity):
             if self.hurt_timer <= 0:
                 self.is_hurt = False
 
-        move_vec = Vector(0, 0)
-        if "w" in pressed_keys:
-            move_vec += Vector(0, 1)
-        if "s" in pressed_keys:
-            move_vec += Vector(0, -1)
-        if "a" in pressed_keys:
-            move_vec += Vector(-1, 0)
-        if "d" in pressed_keys:
-            move_vec += Vector(1, 0)
-
-        prev_anim = self.current_anim
+        move_x = bool(key_bits & KEY_RIGHT) - bool(key_bits & KEY_LEFT)
+        move_y = bool(key_bits & KEY_UP) - bool(key_bits & KEY_DOWN)
+        moving = move_x or move_y
+        running = key_bits & KEY_RUN
 
+        is_shooting = self.is_shooting
+        is_reloading = self.is_reloading
         if self.is_hurt:
-            self.current_anim = "hurt"
-        elif self.is_reloading and "recharge" in self.animations:
-            self.current_anim = "recharge"
-        elif self.is_shooting:
-            self.current_anim = "shot"
-        elif move_vec.length() > 0:
-            self.facing = 1 if move_vec.x >= 0 else -1
-            self.current_anim = "run" if "shift" in pressed_keys else "walk"
+            anim = "hurt"
+        elif is_reloading and "recharge" in self.animations:
+            anim = "recharge"
+        elif is_shooting:
+            anim = "shot"
+        elif moving:
+            self.facing = 1 if move_x >= 0 else -1
+            anim = "run" if running else "walk"
         else:
-            self.current_anim = "idle"
+            anim = "idle"
 
-        if self.current_anim != prev_anim:
+        if anim != self._current_anim:
+            self.current_anim = anim
             self.current_frame = 0
             self.frame_timer = 0.0
 
-        speed = self.speed if self.is_shooting else (self.run_speed if "shift" in pressed_keys else self.speed)
+        speed = self.speed if is_shooting else (self.run_speed if running else self.speed)
         speed *= self.get_status_multiplier("move_speed", default=1.0)
 
-        if move_vec.length() > 0:
-            self.pos = self.pos + move_vec.normalize() * (speed * dt)
+        pos = self.pos
+        if moving:
+            # Diagonals are scaled by 1/sqrt(2) so every direction moves at the same speed
+            step = speed * dt / math.sqrt(move_x * move_x + move_y * move_y)
+            pos.x += move_x * step
+            pos.y += move_y * step
 
-        max_x = max(0, bounds[0] - self.size[0])
-        height = bounds[1]
-        block_unit = height / 10.0
-        min_y, max_y_allowed = block_unit, height - (3 * block_unit) - self.size[1]
-        self.pos.x = max(0, min(self.pos.x, max_x))
-        self.pos.y = max(min_y, min(self.pos.y, max_y_allowed))
+        if self._cached_bounds is not bounds:
+            self._cache_walk_band(bounds)
+        pos.x = max(0, min(pos.x, self._max_x))
+        pos.y = max(self._min_y, min(pos.y, self._max_y))
 
-        frames = self.animations.get(self.current_anim, [])
+        frames = self._current_frames
         if not frames:
             return None
+        frame_count = self._frame_count
 
-        if self.current_anim == "recharge" and self.is_reloading:
-            anim_speed = self.reload_time / len(frames)
+        if anim == "recharge" and is_reloading:
+            anim_speed = self.reload_time / frame_count
         else:
             anim_speed = self.animation_speed
 
-        self.frame_timer += dt
-        if self.frame_timer >= anim_speed:
-            self.frame_timer = 0.0
-            if self.current_anim == "shot" and self.is_shooting and len(frames) >= 5:
-                if self.current_frame < 2 or self.current_frame > 4:
-                    self.current_frame = 2
-                else:
-                    self.current_frame += 1
-                    if self.current_frame > 4:
-                        self.current_frame = 2
+        frame_timer = self.frame_timer + dt
+        current_frame = self.current_frame
+        if frame_timer >= anim_speed:
+            # A long tick can cover several frames; carry the remainder over
+            steps = int(frame_timer / anim_speed)
+            frame_timer -= steps * anim_speed
+            if anim == "shot" and is_shooting and frame_count >= 5:
+                # Held fire loops frames 2-4
+                if current_frame < 2 or current_frame > 4:
+                    current_frame = 2
+                    steps -= 1
+                current_frame = 2 + (current_frame - 2 + steps) % 3
             else:
-                self.current_frame = (self.current_frame + 1) % len(frames)
+                current_frame += steps
+                if current_frame >= frame_count:
+                    current_frame %= frame_count
+            self.current_frame = current_frame
+        self.frame_timer = frame_timer
 
-        return frames[self.current_frame]
+        return frames[current_frame]
 
     def take_damage(self, amount: float):
         self.hp -= amount
@@ -335,69 +416,88 @@ class PlayerEntity(Entity):
             self.current_frame = 0
 
     def get_hitbox(self) -> Tuple[float, float, float, float]:
-        bboxes = self.anim_bboxes.get(self.current_anim)
-        if not bboxes:
-            return (self.pos.x, self.pos.y, self.size[0], self.size[1])
-        bbox = bboxes[self.current_frame % len(bboxes)]
-        bx, by, bw, bh = bbox
-        offset_x = bx * self.size[0] if self.facing == 1 else (1 - (bx + bw)) * self.size[0]
-        offset_y = (1 - (by + bh)) * self.size[1]
-
-        shrink_scale = 0.82
-        raw_w = bw * self.size[0]
-        raw_h = bh * self.size[1]
-        hit_w = raw_w * shrink_scale
-        hit_h = raw_h * shrink_scale
-        inset_x = (raw_w - hit_w) / 2
-        inset_y = (raw_h - hit_h) / 2
-
-        return (
-            self.pos.x + offset_x + inset_x,
-            self.pos.y + offset_y + inset_y,
-            hit_w,
-            hit_h,
-        )
+        # Queried by several collision and debug passes per tick; reuse until something moves
+        pos = self.pos
+        x = pos.x
+        y = pos.y
+        frame = self.current_frame
+        facing = self.facing
+        key = (self._current_anim, frame, facing, x, y)
+        if key == self._hitbox_key:
+            return self._hitbox
+
+        rows = self._current_hit_rows
+        if rows is None:
+            hitbox = (x, y, self.size[0], self.size[1])
+        else:
+            x_right, x_left, y_off, hit_w, hit_h = rows[frame % len(rows)]
+            hitbox = (x + (x_right if facing == 1 else x_left), y + y_off, hit_w, hit_h)
+
+        self._hitbox_key = key
+        self._hitbox = hitbox
+        return hitbox
 
     def get_muzzle_position(self, shot_direction: Optional[Vector] = None) -> Vector:
         muzzle_x_ratio = 0.79 if self.facing == 1 else 0.21
         muzzle_y_ratio = 0.45
 
-        muzzle = Vector(
-            self.pos.x + self.size[0] * muzzle_x_ratio,
-            self.pos.y + self.size[1] * muzzle_y_ratio,
-        )
+        muzzle_x = self.pos.x + self.size[0] * muzzle_x_ratio
+        muzzle_y = self.pos.y + self.size[1] * muzzle_y_ratio
 
-        if shot_direction is not None and shot_direction.length() > 0:
-            muzzle = muzzle + shot_direction.normalize() * (self.size[0] * 0.06)
+        if shot_direction is not None:
+            dir_x, dir_y = shot_direction
+            length = math.sqrt(dir_x * dir_x + dir_y * dir_y)
+            if length > 0:
+                offset = self.size[0] * 0.06
+                muzzle_x += dir_x / length * offset
+                muzzle_y += dir_y / length * offset
 
-        return muzzle
+        return Vector(muzzle_x, muzzle_y)
 
     def draw(self, canvas):
-        texture = self.animations.get(self.current_anim, [None])[self.current_frame]
-        if texture is None:
+        frames = self._current_frames
+        if not frames:
             return
+        texture = frames[self.current_frame]
         x, y = self.pos.x, self.pos.y
         hit_x, hit_y, hit_w, hit_h = self.get_hitbox()
         bar_width = hit_w
         bar_height = 7
         bar_x = hit_x
         bar_y = hit_y + hit_h + 54
-        with canvas:
-            Color(0.15, 0.15, 0.15, 0.7)
-            Rectangle(pos=(bar_x, bar_y), size=(bar_width, bar_height))
-            hp_ratio = max(0.0, min(1.0, self.hp / self.max_hp))
-            Color(0.2 + 0.8 * (1-hp_ratio), 0.8 * hp_ratio, 0.2, 1)
-            Rectangle(pos=(bar_x, bar_y), size=(bar_width * hp_ratio, bar_height))
-
-            if self.hit_flash_timer > 0:
-                Color(1, 0.3, 0.3, 1)
-            else:
-                Color(1, 1, 1, 1)
-            if self.facing == -1:
-                PushMatrix()
-                origin = (x + self.size[0] / 2, y + self.size[1] / 2)
-                Scale(x=-1, y=1, origin=origin)
-                Rectangle(texture=texture, pos=(x, y), size=self.size)
-                PopMatrix()
-            else:
-                Rectangle(texture=texture, pos=(x, y), size=self.size)
\ No newline at end of file
+        self._bar_bg.pos = (bar_x, bar_y)
+        self._bar_bg.size = (bar_width, bar_height)
+        hp_ratio = max(0.0, min(1.0, self.hp / self.max_hp))
+        self._bar_color.rgba = (0.2 + 0.8 * (1-hp_ratio), 0.8 * hp_ratio, 0.2, 1)
+        self._bar_fill.pos = (bar_x, bar_y)
+        self._bar_fill.size = (bar_width * hp_ratio, bar_height)
+
+        self._tint.rgba = (1, 0.3, 0.3, 1) if self.hit_flash_timer > 0 else (1, 1, 1, 1)
+        sprite = self._sprite
+        facing = self.facing
+        if texture is not self._cur_texture or facing != self._cur_facing:
+            # Only touch the texture/UVs when the frame or facing actually changed
+            self._cur_texture = texture
+            self._cur_facing = facing
+            sprite.texture = texture
+            sprite.tex_coords = flip_tex_coords_horizontal(texture.tex_coords) if facing == -1 else texture.tex_coords
+        sprite.pos = (x, y)
+        sprite.size = self.size
+        canvas.add(self._gfx)
+
+    def _build_graphics(self):
+        """Create the instructions reused by draw() every frame."""
+        self._gfx = InstructionGroup()
+        self._gfx.add(Color(0.15, 0.15, 0.15, 0.7))
+        self._bar_bg = Rectangle()
+        self._gfx.add(self._bar_bg)
+        self._bar_color = Color(1, 1, 1, 1)
+        self._gfx.add(self._bar_color)
+        self._bar_fill = Rectangle()
+        self._gfx.add(self._bar_fill)
+        self._tint = Color(1, 1, 1, 1)
+        self._gfx.add(self._tint)
+        self._sprite = Rectangle()
+        self._gfx.add(self._sprite)
+        self._cur_texture = None
+        self._cur_facing = 0
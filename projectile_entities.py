@@ -1,7 +1,7 @@
 from typing import List, Tuple
 import math
 
-from kivy.graphics import Color, PopMatrix, PushMatrix, Rectangle, Rotate
+from kivy.graphics import Color, InstructionGroup, Mesh, PopMatrix, PushMatrix, Rectangle, Rotate
 from kivy.vector import Vector
 
 from entity_base import Entity
@@ -9,19 +9,32 @@ from entity_base import Entity
 
 class BulletEntity(Entity):
     """Projectile fired by player that travels toward cursor direction."""
+    __slots__ = ("speed", "velocity", "angle", "damage", "is_crit", "_quad")
     SIZE = (24, 6)
+    # Every bullet is drawn through one shared Mesh, see draw_all
+    _batch_gfx = None
+    _batch_mesh = None
+    _batch_indices: List[int] = []
 
     def __init__(self, pos: Vector, direction: Vector):
         super().__init__(pos=pos, size=self.SIZE, color=(1, 1, 0))
         self.speed = 800
-        if direction.length() == 0:
-            direction = Vector(1, 0)
-        self.velocity = direction.normalize() * self.speed
+        dir_x, dir_y = direction
+        length = math.sqrt(dir_x * dir_x + dir_y * dir_y)
+        if length == 0:
+            dir_x, dir_y, length = 1.0, 0.0, 1.0
+        self.velocity = Vector(dir_x / length * self.speed, dir_y / length * self.speed)
         self.angle = math.degrees(math.atan2(self.velocity.y, self.velocity.x))
+        self._build_quad()
+        if BulletEntity._batch_gfx is None:
+            BulletEntity._build_batch_graphics()
 
     def update(self, dt: float):
         self.update_statuses(dt)
-        self.move(Vector(self.velocity.x * dt, self.velocity.y * dt))
+        pos = self.pos
+        velocity = self.velocity
+        pos.x += velocity.x * dt
+        pos.y += velocity.y * dt
 
     def get_hitbox(self) -> Tuple[float, float, float, float]:
         """Returns the bullet's hitbox as (x, y, width, height)."""
@@ -34,18 +47,69 @@ class BulletEntity(Entity):
         return (self.pos.x - offset_x, self.pos.y - offset_y, hit_w, hit_h)
 
     def draw(self, canvas):
-        with canvas:
-            Color(*self.color)
-            PushMatrix()
-            center_x = self.pos.x + self.size[0] / 2
-            center_y = self.pos.y + self.size[1] / 2
-            Rotate(angle=self.angle, origin=(center_x, center_y))
-            Rectangle(pos=self.pos, size=self.size)
-            PopMatrix()
+        self.draw_all((self,), canvas)
+
+    @classmethod
+    def draw_all(cls, bullets, canvas):
+        """Draw every bullet with one shared Mesh.
+
+        The mesh is rebuilt from scratch on each call, so pass the whole
+        bullet list once per frame rather than drawing bullets one by one.
+        """
+        if not bullets:
+            return
+        vertices = []
+        extend = vertices.extend
+        for b in bullets:
+            pos = b.pos
+            x = pos.x
+            y = pos.y
+            x0, y0, x1, y1, x2, y2, x3, y3 = b._quad
+            extend((x + x0, y + y0, 0.0, 0.0, x + x1, y + y1, 0.0, 0.0,
+                    x + x2, y + y2, 0.0, 0.0, x + x3, y + y3, 0.0, 0.0))
+
+        count = len(bullets)
+        indices = cls._batch_indices
+        for i in range(len(indices) // 6, count):
+            base = i * 4
+            indices.extend((base, base + 1, base + 2, base + 2, base + 3, base))
+        cls._batch_mesh.vertices = vertices
+        cls._batch_mesh.indices = indices[:count * 6]
+        canvas.add(cls._batch_gfx)
+
+    @classmethod
+    def _build_batch_graphics(cls):
+        """Create the shared bullet Mesh.
+
+        Called from __init__ rather than draw_all: instructions created inside
+        a ``with canvas:`` block are also added to that canvas.
+        """
+        cls._batch_gfx = InstructionGroup()
+        cls._batch_gfx.add(Color(1, 1, 0))
+        cls._batch_mesh = Mesh(mode="triangles")
+        cls._batch_gfx.add(cls._batch_mesh)
+
+    def _build_quad(self):
+        """Precompute the rotated corners relative to ``pos``; the angle never changes in flight."""
+        width, height = self.size
+        half_w = width / 2
+        half_h = height / 2
+        rad = math.radians(self.angle)
+        cos_a = math.cos(rad)
+        sin_a = math.sin(rad)
+        quad = []
+        for corner_x, corner_y in ((-half_w, -half_h), (half_w, -half_h), (half_w, half_h), (-half_w, half_h)):
+            quad.append(half_w + corner_x * cos_a - corner_y * sin_a)
+            quad.append(half_h + corner_x * sin_a + corner_y * cos_a)
+        self._quad = tuple(quad)
 
 
 class EnemyProjectileEntity(Entity):
     """Projectile fired by enemies (e.g., Kitsune's fire)."""
+    __slots__ = (
+        "velocity", "angle", "fire_textures", "current_frame", "frame_timer", "animation_speed", "hit",
+        "_gfx", "_rotate", "_rect",
+    )
 
     def __init__(self, pos, target_pos, fire_textures: List = None):
         if not isinstance(pos, Vector):
@@ -55,9 +119,10 @@ class EnemyProjectileEntity(Entity):
 
         super().__init__(pos=pos, size=(160, 160), color=(1, 0.5, 0))
 
-        projectile_center = self.pos + Vector(self.size[0] / 2, self.size[1] / 2)
-        direction = target_pos - projectile_center
-        self.velocity = direction.normalize() * 450 if direction.length() > 0 else Vector(0, 0)
+        dx = target_pos.x - (self.pos.x + self.size[0] / 2)
+        dy = target_pos.y - (self.pos.y + self.size[1] / 2)
+        length = math.sqrt(dx * dx + dy * dy)
+        self.velocity = Vector(dx / length * 450, dy / length * 450) if length > 0 else Vector(0, 0)
         self.angle = math.degrees(math.atan2(self.velocity.y, self.velocity.x))
 
         self.fire_textures = fire_textures or []
@@ -65,11 +130,14 @@ class EnemyProjectileEntity(Entity):
         self.frame_timer = 0.0
         self.animation_speed = 0.05
         self.hit = False
+        self._build_graphics()
 
     def update(self, dt: float):
         self.update_statuses(dt)
-        delta = Vector(self.velocity.x * dt, self.velocity.y * dt)
-        self.pos = self.pos + delta
+        pos = self.pos
+        velocity = self.velocity
+        pos.x += velocity.x * dt
+        pos.y += velocity.y * dt
 
         if self.fire_textures:
             self.frame_timer += dt
@@ -83,16 +151,27 @@ class EnemyProjectileEntity(Entity):
         return (self.pos.x + offset, self.pos.y + offset, hitbox_size, hitbox_size)
 
     def draw(self, canvas):
-        with canvas:
-            if self.fire_textures and len(self.fire_textures) > 0:
-                texture = self.fire_textures[self.current_frame]
-                Color(1, 1, 1, 1)
-                PushMatrix()
-                center_x = self.pos.x + self.size[0] / 2
-                center_y = self.pos.y + self.size[1] / 2
-                Rotate(angle=self.angle, origin=(center_x, center_y))
-                Rectangle(texture=texture, pos=self.pos, size=self.size)
-                PopMatrix()
-            else:
-                Color(*self.color)
-                Rectangle(pos=self.pos, size=self.size)
+        x = self.pos.x
+        y = self.pos.y
+        if self._rotate is not None:
+            self._rotate.origin = (x + self.size[0] / 2, y + self.size[1] / 2)
+            self._rect.texture = self.fire_textures[self.current_frame]
+        self._rect.pos = (x, y)
+        canvas.add(self._gfx)
+
+    def _build_graphics(self):
+        """Create the instructions reused by draw() every frame."""
+        self._gfx = InstructionGroup()
+        self._rect = Rectangle(size=self.size)
+        if self.fire_textures:
+            self._gfx.add(Color(1, 1, 1, 1))
+            self._gfx.add(PushMatrix())
+            self._rotate = Rotate(angle=self.angle)
+            self._gfx.add(self._rotate)
+            self._gfx.add(self._rect)
+            self._gfx.add(PopMatrix())
+        else:
+            # Untextured fallback is drawn unrotated
+            self._rotate = None
+            self._gfx.add(Color(*self.color))
+            self._gfx.add(self._rect)
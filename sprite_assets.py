@@ -0,0 +1,365 @@
+"""Sprite asset helpers shared by the entity modules.
+
+Alpha-channel bounding boxes are expensive to compute but only depend on
+the PNG contents, so they are persisted to ``BBOX_CACHE_PATH`` and reused
+on later launches as long as each file is unchanged. The cache is shipped
+with the game (regenerate it with ``build_bbox_cache.py``), so a file
+whose mtime differs, e.g. after a fresh checkout, is still accepted when
+its size and CRC-32 match.
+"""
+import os
+import pickle
+import threading
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Callable, Collection, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from kivy.clock import Clock
+from kivy.core.image import ImageData, ImageLoader
+from kivy.graphics.texture import Texture
+
+BBOX_CACHE_PATH = ".bbox_cache.pkl"
+# Bump when the cache layout changes so older files are ignored
+BBOX_CACHE_VERSION = 3
+# Pixels with alpha above this count as part of the sprite's bounding box
+BBOX_ALPHA_THRESHOLD = 10
+ATLAS_MAX_SIZE = 2048
+ATLAS_PADDING = 2
+
+# Largest packed RGBA value whose alpha is still at or below the threshold
+_ALPHA_PACKED_LIMIT = (BBOX_ALPHA_THRESHOLD << 24) | 0xFFFFFF
+
+# (mtime, size, crc32)
+_FileSignature = Tuple[float, int, int]
+_BBox = Tuple[float, float, float, float]
+
+# frame path -> (file signature, normalized bbox)
+_bbox_disk_cache: Dict[str, Tuple[_FileSignature, _BBox]] = {}
+_bbox_disk_cache_loaded = False
+_bbox_disk_cache_dirty = False
+# Decode workers store bboxes while the main thread may be loading or saving the cache
+_bbox_cache_lock = threading.Lock()
+
+# RGBA colour tuple -> swatch texture
+_swatch_cache: Dict[Tuple, Texture] = {}
+
+# texture -> pixel bytes, only populated inside shared_pixel_reads()
+_pixel_cache: Optional[Dict[object, bytes]] = None
+
+# Set once a decoded image's pixels could not be reached from a worker thread
+_decoded_pixels_unavailable = False
+
+
+def _file_crc32(path: str) -> int:
+    with open(path, "rb") as fh:
+        return zlib.crc32(fh.read())
+
+
+def _file_signature(path: str) -> _FileSignature:
+    stat = os.stat(path)
+    return (stat.st_mtime, stat.st_size, _file_crc32(path))
+
+
+def _bbox_cache_params() -> Tuple[int, int]:
+    return (BBOX_CACHE_VERSION, BBOX_ALPHA_THRESHOLD)
+
+
+def _ensure_bbox_cache_loaded():
+    global _bbox_disk_cache_loaded
+    if _bbox_disk_cache_loaded:
+        return
+    with _bbox_cache_lock:
+        if _bbox_disk_cache_loaded:
+            return
+        try:
+            with open(BBOX_CACHE_PATH, "rb") as fh:
+                data = pickle.load(fh)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            data = None
+        # Entries computed with different scan parameters are stale
+        if isinstance(data, dict) and data.get("params") == _bbox_cache_params():
+            _bbox_disk_cache.update(data.get("entries", {}))
+        # Only flag the cache as loaded once it is filled, so other threads never see it half-read
+        _bbox_disk_cache_loaded = True
+
+
+def get_cached_bbox(path: str) -> Optional[_BBox]:
+    """Return the stored bbox for ``path`` if the file is unchanged, else None."""
+    _ensure_bbox_cache_loaded()
+    entry = _bbox_disk_cache.get(path)
+    if entry is None:
+        return None
+    mtime, size, crc = entry[0]
+    try:
+        stat = os.stat(path)
+        if stat.st_size != size:
+            return None
+        # Only hash the file when the cheap mtime check fails
+        if stat.st_mtime != mtime and _file_crc32(path) != crc:
+            return None
+    except OSError:
+        return None
+    return entry[1]
+
+
+def store_bbox(path: str, bbox: _BBox):
+    global _bbox_disk_cache_dirty
+    try:
+        signature = _file_signature(path)
+    except OSError:
+        return
+    with _bbox_cache_lock:
+        _bbox_disk_cache[path] = (signature, bbox)
+        _bbox_disk_cache_dirty = True
+
+
+def save_bbox_cache():
+    """Write the bbox cache to disk if anything new was computed."""
+    global _bbox_disk_cache_dirty
+    # Pickle a snapshot: another class's decode workers may still be storing entries
+    with _bbox_cache_lock:
+        if not _bbox_disk_cache_dirty:
+            return
+        entries = dict(_bbox_disk_cache)
+        _bbox_disk_cache_dirty = False
+    tmp_path = BBOX_CACHE_PATH + ".tmp"
+    try:
+        with open(tmp_path, "wb") as fh:
+            data = {"params": _bbox_cache_params(), "entries": entries}
+            pickle.dump(data, fh, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, BBOX_CACHE_PATH)
+    except OSError as exc:
+        print(f"Failed to save bbox cache: {exc}")
+        with _bbox_cache_lock:
+            _bbox_disk_cache_dirty = True
+
+
+@contextmanager
+def shared_pixel_reads():
+    """Read each texture's pixels from the GPU at most once within the block.
+
+    The bbox scan and the atlas packer both need the raw RGBA bytes during
+    preload; ``Texture.pixels`` downloads them again on every access.
+    """
+    global _pixel_cache
+    _pixel_cache = {}
+    try:
+        yield
+    finally:
+        _pixel_cache = None
+
+
+def read_pixels(texture, last_use: bool = False) -> bytes:
+    """Return ``texture.pixels``, shared within ``shared_pixel_reads()``.
+
+    Pass ``last_use=True`` from the final consumer so the buffer can be freed
+    straight away instead of at the end of the block.
+    """
+    if _pixel_cache is None:
+        return texture.pixels
+    if last_use:
+        pixels = _pixel_cache.pop(texture, None)
+        return texture.pixels if pixels is None else pixels
+    pixels = _pixel_cache.get(texture)
+    if pixels is None:
+        pixels = _pixel_cache[texture] = texture.pixels
+    return pixels
+
+
+def compute_alpha_bbox(texture) -> _BBox:
+    """Return the normalized ``(x, y, w, h)`` box around the texture's opaque pixels."""
+    w, h = texture.size
+    return _alpha_bbox(read_pixels(texture), w, h)
+
+
+def _alpha_bbox(pixels, w: int, h: int) -> _BBox:
+    # One little-endian uint32 per RGBA pixel puts alpha in the top byte, so a
+    # single compare against the threshold tests a whole pixel at once.
+    packed = np.frombuffer(pixels, dtype="<u4").reshape(h, w)
+    # Find the occupied row band first, then only test columns inside it; sprite
+    # frames are mostly transparent padding above and below the figure.
+    rows = packed.max(axis=1) > _ALPHA_PACKED_LIMIT
+    if not rows.any():
+        return (0.0, 0.0, 1.0, 1.0)
+    first_row = int(rows.argmax())
+    last_row = len(rows) - 1 - int(rows[::-1].argmax())
+    cols = (packed[first_row:last_row + 1] > _ALPHA_PACKED_LIMIT).any(axis=0)
+    min_x = int(cols.argmax())
+    max_x = w - 1 - int(cols[::-1].argmax())
+    return (min_x / w, first_row / h, (max_x - min_x + 1) / w, (last_row - first_row + 1) / h)
+
+
+def hitbox_params(bboxes: List[Tuple[float, float, float, float]], shrink: float) -> np.ndarray:
+    """Turn normalized sprite bboxes into per-frame hitbox fractions.
+
+    Each row is ``(x facing right, x facing left, y, w, h)`` as fractions of
+    the sprite size, with the centred ``shrink`` already applied.
+    """
+    bx, by, bw, bh = np.asarray(bboxes, dtype=np.float64).reshape(-1, 4).T
+    inset_x = bw * (1 - shrink) / 2
+    inset_y = bh * (1 - shrink) / 2
+    return np.stack(
+        [bx + inset_x, 1 - (bx + bw) + inset_x, 1 - (by + bh) + inset_y, bw * shrink, bh * shrink],
+        axis=1,
+    ).astype(np.float32)
+
+
+def scale_hitbox_params(anim_hit_params: Dict[str, np.ndarray], width: float, height: float) -> Dict[str, List[List[float]]]:
+    """Bake one sprite size into per-animation ``hitbox_params`` tables.
+
+    Rows become ``[x facing right, x facing left, y, w, h]`` in pixels, so a
+    hitbox is just the entity position plus a row.
+    """
+    scale = np.array((width, width, height, width, height))
+    return {name: (params * scale).tolist() for name, params in anim_hit_params.items()}
+
+
+def flip_tex_coords_horizontal(tex_coords):
+    """Mirror a quad's ``tex_coords`` left-to-right.
+
+    Swapping the left and right vertices' UVs flips the sprite without the
+    ``PushMatrix``/``Scale``/``PopMatrix`` sequence.
+    """
+    u0, v0, u1, v1, u2, v2, u3, v3 = tex_coords
+    return (u1, v1, u0, v0, u3, v3, u2, v2)
+
+
+def swatch_texture(colors: Tuple[Tuple[float, float, float, float], ...]) -> Texture:
+    """Return a one-row texture with one texel per RGBA colour in ``colors``.
+
+    Quads that sample texel ``i`` at u = (i + 0.5) / len(colors) draw in that
+    flat colour, so differently coloured shapes can share one Mesh.
+    """
+    texture = _swatch_cache.get(colors)
+    if texture is None:
+        texture = Texture.create(size=(len(colors), 1), colorfmt="rgba")
+        texture.min_filter = "nearest"
+        texture.mag_filter = "nearest"
+        data = bytes(int(round(channel * 255)) for rgba in colors for channel in rgba)
+        texture.blit_buffer(data, colorfmt="rgba", bufferfmt="ubyte")
+        _swatch_cache[colors] = texture
+    return texture
+
+
+def _decode_image(path: str, scan_bbox: bool = False):
+    try:
+        image = ImageLoader.load(path)
+    except Exception:
+        return None
+    if scan_bbox and get_cached_bbox(path) is None:
+        # The decoded pixels are still on the CPU here (they are dropped once
+        # the texture is created), so uncached bboxes cost the main thread nothing.
+        data = _decoded_image_data(image)
+        if data is not None and data.fmt == "rgba" and len(data.data) == data.width * data.height * 4:
+            store_bbox(path, _alpha_bbox(data.data, data.width, data.height))
+    return image
+
+
+def _decoded_image_data(image) -> Optional[ImageData]:
+    """Return the first ImageData a loader decoded, or None if it can't be reached.
+
+    Kivy's loaders expose no public accessor for their decoded frames, so this
+    reads the loader's ``_data`` list. If a Kivy release changes that, bboxes
+    are scanned from the texture on the main thread instead.
+    """
+    global _decoded_pixels_unavailable
+    frames = getattr(image, "_data", None)
+    if frames and isinstance(frames[0], ImageData):
+        return frames[0]
+    if not _decoded_pixels_unavailable:
+        _decoded_pixels_unavailable = True
+        print("Decoded image pixels are not accessible in this Kivy version; "
+              "scanning sprite bboxes on the main thread instead")
+    return None
+
+
+def decode_images(paths: List[str], max_workers: int = 8, bbox_paths: Collection[str] = ()) -> Dict[str, object]:
+    """Decode image files on a thread pool.
+
+    Returns ``{path: image}`` for every file that decoded. Only CPU-side pixel
+    data is produced here; GL textures must still be created on the main
+    thread by reading ``image.texture``. Files in ``bbox_paths`` that are
+    missing from the bbox cache are scanned (see compute_alpha_bbox) on the
+    pool as well.
+    """
+    _ensure_bbox_cache_loaded()
+    bbox_paths = set(bbox_paths)
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        images = pool.map(lambda path: _decode_image(path, path in bbox_paths), paths)
+    return {path: image for path, image in zip(paths, images) if image is not None}
+
+
+def decode_images_async(paths: List[str], callback: Callable[[Dict[str, object]], None],
+                        bbox_paths: Collection[str] = ()):
+    """Run decode_images on a background thread.
+
+    ``callback`` receives the ``{path: image}`` dict on the main thread (via
+    the Kivy Clock), where it is safe to create textures.
+    """
+    def worker():
+        decoded = {}
+        try:
+            decoded = decode_images(paths, bbox_paths=bbox_paths)
+        finally:
+            # Always call back, even with nothing decoded, so a failed decode can't
+            # leave the caller waiting; missing images are loaded on the main thread.
+            Clock.schedule_once(lambda _dt: callback(decoded))
+
+    threading.Thread(target=worker, daemon=True).start()
+
+
+def pack_textures(textures: List, max_size: int = ATLAS_MAX_SIZE, padding: int = ATLAS_PADDING) -> List:
+    """Copy ``textures`` into shared atlas pages.
+
+    Frames are sorted by height and laid out left to right on shelves; a new
+    page is started when one fills up. Returns a texture region per input, in
+    the same order, that draws exactly like the original texture. Anything
+    too large for a page is returned unchanged.
+    """
+    placements: List[Optional[Tuple[int, int, int]]] = [None] * len(textures)
+    pages: List[Tuple[int, int]] = []
+    x = y = shelf_h = used_w = 0
+    for idx in sorted(range(len(textures)), key=lambda i: textures[i].height, reverse=True):
+        w, h = textures[idx].size
+        if w + 2 * padding > max_size or h + 2 * padding > max_size:
+            continue
+        if x + w + 2 * padding > max_size:
+            # Start a new shelf
+            y += shelf_h
+            x = shelf_h = 0
+        if y + h + 2 * padding > max_size:
+            # Start a new page
+            pages.append((used_w + padding, y + padding))
+            x = y = shelf_h = used_w = 0
+        placements[idx] = (len(pages), x + padding, y + padding)
+        x += w + padding
+        shelf_h = max(shelf_h, h + padding)
+        used_w = max(used_w, x)
+    if shelf_h:
+        pages.append((used_w + padding, y + shelf_h + padding))
+
+    atlases = []
+    for page_w, page_h in pages:
+        atlas = Texture.create(size=(page_w, page_h), colorfmt="rgba")
+        # Clear the page so the padding between frames stays transparent
+        atlas.blit_buffer(bytes(page_w * page_h * 4), colorfmt="rgba", bufferfmt="ubyte")
+        atlases.append(atlas)
+
+    regions = []
+    for texture, placement in zip(textures, placements):
+        if placement is None:
+            regions.append(texture)
+            continue
+        page, x, y = placement
+        w, h = texture.size
+        atlas = atlases[page]
+        atlas.blit_buffer(read_pixels(texture, last_use=True), pos=(x, y), size=(w, h), colorfmt="rgba", bufferfmt="ubyte")
+        region = atlas.get_region(x, y, w, h)
+        # Image textures are stored top row first and flipped via tex_coords; keep that
+        if texture.tex_coords[1] > texture.tex_coords[7]:
+            region.flip_vertical()
+        regions.append(region)
+    return regions
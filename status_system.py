@@ -56,6 +56,9 @@ class StatusComponent:
         return self._effects.get(name)
 
     def update(self, dt: float):
+        # Most entities carry no statuses; skip the list allocation for them
+        if not self._effects:
+            return
         expired = []
         for name, effect in self._effects.items():
             effect.duration -= dt
@@ -65,6 +68,8 @@ class StatusComponent:
             del self._effects[name]
 
     def get_multiplier(self, stat_name: str, default: float = 1.0) -> float:
+        if not self._effects:
+            return default
         value = default
         for effect in self._effects.values():
             if stat_name in effect.modifiers: